@@ -0,0 +1,186 @@
+"""
+Static menu screens generated by build_menu_text.py from menu_spec.json - do not edit
+"""
+
+MENU = (
+    '🌟================================================================================🌟\n'
+    '        AZURE RESOURCES DIAGRAM GENERATOR - COMPLETE SUITE\n'
+    '🌟================================================================================🌟\n'
+    '\n'
+    '📁 Generated Files:\n'
+    '   ├── 📊 azure_diagrams/azure_resources_comprehensive_guide.txt\n'
+    '   ├── 📋 azure_diagrams/azure_service_selection_matrix.txt\n'
+    '   ├── 🎨 azure_diagrams/azure_ascii_diagram.txt\n'
+    '   ├── 📚 azure_services_catalog.json\n'
+    '   └── 📖 README.md\n'
+    '\n'
+    '🚀 Available Tools:\n'
+    '   1. 📖 View Comprehensive Azure Guide\n'
+    '   2. 🎨 View ASCII Diagram\n'
+    '   3. 📋 View Service Selection Matrix\n'
+    '   4. 🔍 Interactive Azure Explorer\n'
+    '   5. 📊 Export Services Catalog (JSON)\n'
+    '   6. 💡 Show Quick Tips\n'
+    '   7. 🏗️  Show Architecture Examples\n'
+    '   8. 💰 Show Cost Optimization Tips\n'
+    '   9. 🔧 Generate Additional Diagrams\n'
+    '   0. 🚪 Exit\n'
+    '   m. 📜 Show this menu again\n'
+    '\n'
+)
+
+TIPS = (
+    '\n'
+    '💡 AZURE QUICK TIPS & BEST PRACTICES\n'
+    '\n'
+    '🏷️  NAMING CONVENTIONS:\n'
+    '   - Use consistent naming: rg-prod-eastus-001\n'
+    '   - Include environment: dev, test, prod\n'
+    '   - Include location: eastus, westeurope\n'
+    '   - Include purpose: web, db, storage\n'
+    '\n'
+    '🔒 SECURITY BEST PRACTICES:\n'
+    '   - Always use Azure AD for authentication\n'
+    '   - Store secrets in Key Vault\n'
+    '   - Enable MFA for all accounts\n'
+    '   - Use Network Security Groups\n'
+    '   - Regular security reviews with Security Center\n'
+    '\n'
+    '💰 COST OPTIMIZATION:\n'
+    '   - Use Reserved Instances for predictable workloads (up to 72% savings)\n'
+    '   - Implement auto-scaling to match demand\n'
+    '   - Use Azure Spot VMs for fault-tolerant workloads (up to 90% savings)\n'
+    '   - Regular resource right-sizing\n'
+    '   - Set up cost alerts and budgets\n'
+    '\n'
+    '📊 MONITORING & PERFORMANCE:\n'
+    '   - Enable Application Insights for all applications\n'
+    '   - Set up Azure Monitor dashboards\n'
+    '   - Use Log Analytics for centralized logging\n'
+    '   - Configure alerts for critical metrics\n'
+    '   - Regular performance reviews\n'
+    '\n'
+    '🏗️  ARCHITECTURE PRINCIPLES:\n'
+    '   - Design for failure (availability zones)\n'
+    '   - Use managed services when possible\n'
+    '   - Implement proper backup strategies\n'
+    '   - Plan for disaster recovery\n'
+    '   - Use Infrastructure as Code (ARM, Terraform)\n'
+    '\n'
+)
+
+ARCH = (
+    '\n'
+    '🏗️  COMMON AZURE ARCHITECTURES\n'
+    '\n'
+    '📱 BASIC WEB APPLICATION:\n'
+    '   Internet → Azure Front Door → App Service → Azure SQL Database\n'
+    '                                    ↓\n'
+    '                              Azure Blob Storage (for static content)\n'
+    '   \n'
+    '   Cost: ~$100-500/month\n'
+    '   Use cases: Small to medium websites, APIs\n'
+    '\n'
+    '🐳 MICROSERVICES ARCHITECTURE:\n'
+    '   Internet → API Management → Azure Kubernetes Service (AKS)\n'
+    '                                        ↓\n'
+    '                              Azure Service Bus ← → Cosmos DB\n'
+    '                                        ↓              ↓\n'
+    '                                Redis Cache        Event Grid\n'
+    '   \n'
+    '   Cost: ~$500-2000/month\n'
+    '   Use cases: Large applications, high scalability needs\n'
+    '\n'
+    '⚡ SERVERLESS ARCHITECTURE:\n'
+    '   Event Grid → Azure Functions → Cosmos DB\n'
+    '        ↓              ↓              ↓\n'
+    '   Logic Apps → Storage Queue → Table Storage\n'
+    '   \n'
+    '   Cost: Pay-per-execution (very low for sporadic usage)\n'
+    '   Use cases: Event-driven apps, batch processing\n'
+    '\n'
+    '📊 BIG DATA ANALYTICS:\n'
+    '   IoT Devices → Event Hubs → Stream Analytics → Data Lake Storage Gen2\n'
+    '                                     ↓                    ↓\n'
+    '                              Cosmos DB           Synapse Analytics\n'
+    '                                     ↓                    ↓\n'
+    '                            Machine Learning       Power BI Dashboard\n'
+    '   \n'
+    '   Cost: ~$1000-5000/month\n'
+    '   Use cases: Real-time analytics, IoT data processing\n'
+    '\n'
+    '🎮 GAMING BACKEND:\n'
+    '   Game Clients → Traffic Manager → App Service (multiple regions)\n'
+    '                                          ↓\n'
+    '                     Redis Cache ← → Cosmos DB (globally distributed)\n'
+    '                                          ↓\n'
+    '                               Azure Functions (game logic)\n'
+    '   \n'
+    '   Cost: ~$300-1500/month\n'
+    '   Use cases: Mobile games, multiplayer games\n'
+    '\n'
+    '🔒 ENTERPRISE SECURITY:\n'
+    '   On-premises → ExpressRoute → Azure Virtual Network\n'
+    '                                        ↓\n'
+    '                    Azure AD ← → Key Vault ← → Security Center\n'
+    '                        ↓              ↓              ↓\n'
+    '                 Conditional      Secrets &     Threat Detection\n'
+    '                   Access       Certificates\n'
+    '   \n'
+    '   Cost: ~$200-1000/month\n'
+    '   Use cases: Enterprise applications, compliance requirements\n'
+    '\n'
+)
+
+COST = (
+    '\n'
+    '💰 AZURE COST OPTIMIZATION STRATEGIES\n'
+    '\n'
+    '🎯 COMPUTE OPTIMIZATION:\n'
+    '   • Reserved Instances: 1-3 year commitments save up to 72%\n'
+    '   • Azure Spot VMs: Use spare capacity for up to 90% savings\n'
+    '   • Auto-scaling: Scale resources based on demand\n'
+    '   • Right-sizing: Regular review and adjust VM sizes\n'
+    '   • B-series VMs: For variable workloads with CPU bursting\n'
+    '\n'
+    '💾 STORAGE OPTIMIZATION:\n'
+    '   • Lifecycle Management: Auto-move data to cooler tiers\n'
+    '   • Hot Tier: Frequently accessed data\n'
+    '   • Cool Tier: Infrequently accessed (30+ days) - 50% cheaper\n'
+    '   • Archive Tier: Rarely accessed (180+ days) - 80% cheaper\n'
+    '   • Data Deduplication: Reduce redundant data\n'
+    '\n'
+    '🗄️  DATABASE OPTIMIZATION:\n'
+    '   • Azure SQL Database: Use appropriate service tier\n'
+    '   • Serverless: Auto-pause for development databases\n'
+    '   • Read Replicas: Offload read operations\n'
+    '   • Elastic Pools: Share resources across databases\n'
+    '   • Reserved Capacity: For predictable workloads\n'
+    '\n'
+    '🌐 NETWORKING OPTIMIZATION:\n'
+    '   • CDN: Reduce bandwidth costs and improve performance\n'
+    '   • ExpressRoute: For large data transfers vs. VPN\n'
+    '   • Traffic Manager: Route to least expensive regions\n'
+    '   • Private Endpoints: Reduce data transfer costs\n'
+    '\n'
+    '📊 MONITORING & GOVERNANCE:\n'
+    '   • Azure Cost Management: Set budgets and alerts\n'
+    '   • Azure Advisor: Get personalized recommendations\n'
+    '   • Resource Tags: Track costs by project/department\n'
+    '   • Azure Policy: Enforce cost controls\n'
+    '   • Regular Reviews: Monthly cost analysis\n'
+    '\n'
+    '💡 PRO TIPS:\n'
+    '   • Use Azure Pricing Calculator for estimates\n'
+    '   • Take advantage of Azure Credits (Visual Studio, MSDN)\n'
+    '   • Consider Azure Dev/Test pricing for non-production\n'
+    '   • Use Azure Migrate for cost-effective cloud migration planning\n'
+    '   • Implement Infrastructure as Code for consistent deployments\n'
+    '\n'
+    '📈 COST ESTIMATION EXAMPLES:\n'
+    '   Small Business:     $100-500/month\n'
+    '   Medium Enterprise:  $1,000-5,000/month  \n'
+    '   Large Enterprise:   $10,000-50,000/month\n'
+    '   Global Enterprise:  $100,000+/month\n'
+    '\n'
+)
@@ -4,174 +4,161 @@ Interactive Azure Resources Explorer
 Allows users to explore Azure services by category and generate custom diagrams.
 """
 
+import hashlib
 import json
-from typing import Dict, List, Any
+import mmap
+import os
+import pickle
+import re
+import sys
+import tempfile
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib parser works too
+    orjson = None
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+except ImportError:  # prompt_toolkit is optional, the explorer falls back to input()
+    PromptSession = None
+
+CATALOG_DIR = Path(__file__).parent / "catalog"
+CACHE_DIR = Path("~/.cache/azure_explorer").expanduser()
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, preferring orjson"""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _load_cached_json(path: Path) -> Any:
+    """Load a JSON file through a pickled copy in CACHE_DIR, keyed on the file's path, mtime and size"""
+    source = path.resolve()
+    st = source.stat()
+    version = (st.st_mtime_ns, st.st_size)
+    # Checkouts share CACHE_DIR, so each source path gets its own cache file
+    digest = hashlib.blake2b(str(source).encode("utf-8"), digest_size=8).hexdigest()
+    cache_file = CACHE_DIR / f"{path.stem}-{digest}.pkl"
+    try:
+        with open(cache_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            cached_source, cached_version, data = pickle.loads(mm)
+        if cached_source == str(source) and cached_version == version:
+            return data
+    except (OSError, ValueError, TypeError, EOFError, pickle.UnpicklingError):
+        pass  # missing, unreadable or old-format cache, rebuild it below
+    
+    data = _read_json(path)
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A per-process temp file keeps concurrent writers from truncating each other's output
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, prefix=f"{path.stem}-", suffix=".tmp",
+                                         delete=False) as f:
+            tmp_name = f.name
+            pickle.dump((str(source), version, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        # caching is best effort, e.g. on a read-only home directory
+        if tmp_name is not None:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+    return data
+
+def _freeze_catalog(obj: Any) -> Any:
+    """Return a copy of parsed catalog data with strings interned and lists turned into tuples"""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {sys.intern(key): _freeze_catalog(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return tuple(_freeze_catalog(item) for item in obj)
+    return obj
+
+@lru_cache(maxsize=128)
+def _compile_terms(terms: Tuple[str, ...]) -> "re.Pattern":
+    """Compile lowercased search terms into one alternation pattern"""
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+class _LazyCatalog(Mapping):
+    """Read-only category mapping that loads catalog/<category>.json on first access"""
+    
+    def __init__(self, catalog_dir: Path):
+        self._catalog_dir = catalog_dir
+        self._index = _freeze_catalog(_load_cached_json(catalog_dir / "_index.json"))
+        self._categories = {}
+    
+    def __getitem__(self, category: str) -> Dict[str, Any]:
+        if category not in self._categories:
+            metadata = self._index[category]
+            services = _freeze_catalog(_load_cached_json(self._catalog_dir / f"{category}.json"))
+            self._categories[category] = {**metadata, "services": services}
+        return self._categories[category]
+    
+    def __iter__(self):
+        return iter(self._index)
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def metadata(self, category: str) -> Dict[str, Any]:
+        """Name and description of a category, without loading its services"""
+        return self._index.get(category, {})
+
+@dataclass(frozen=True)
+class ServiceEntry:
+    """Flat, immutable record of one catalog service as seen by search"""
+    __slots__ = ("category", "service_key", "category_name", "name", "description", "use_cases")
+    
+    category: str
+    service_key: str
+    category_name: Optional[str]
+    name: Optional[str]
+    description: Optional[str]
+    use_cases: Tuple[str, ...]
+    
+    def to_search_result(self) -> Dict[str, Any]:
+        """Shape the entry like a search_services result"""
+        return {
+            "category": self.category,
+            "service_key": self.service_key,
+            "name": self.name,
+            "description": self.description,
+            "category_name": self.category_name
+        }
+
+@lru_cache(maxsize=1)
+def _load_catalog() -> _LazyCatalog:
+    """Open the static services catalog once and share it across explorers"""
+    return _LazyCatalog(CATALOG_DIR)
 
 class AzureResourceExplorer:
     """Interactive explorer for Azure resources"""
     
     def __init__(self):
         self.azure_services = self._load_azure_services()
+        # (category, service) -> service data, filled one category at a time
+        self._flat_services = {}
+        self._flattened_categories = set()
+        # Search structures need every category loaded, so build them on the first search
+        self._entries = None
+        self._columns = None
+        self._search_blobs = None
+        # Row lookups only depend on the query and the shared, read-only catalog
+        self._cached_rows = lru_cache(maxsize=256)(self._find_rows)
     
-    def _load_azure_services(self) -> Dict[str, Any]:
+    def _load_azure_services(self) -> Mapping:
         """Load comprehensive Azure services catalog"""
-        return {
-            "compute": {
-                "name": "Compute Services",
-                "description": "Services for running applications and workloads",
-                "services": {
-                    "virtual_machines": {
-                        "name": "Virtual Machines",
-                        "description": "Scalable, on-demand computing resources",
-                        "use_cases": ["Web servers", "Application servers", "Database servers", "Development environments"],
-                        "pricing_models": ["Pay-as-you-go", "Reserved instances", "Spot instances"],
-                        "sizes": ["B-series (Burstable)", "D-series (General purpose)", "F-series (Compute optimized)", "M-series (Memory optimized)"]
-                    },
-                    "app_service": {
-                        "name": "App Service",
-                        "description": "Fully managed platform for building web apps and APIs",
-                        "use_cases": ["Web applications", "REST APIs", "Mobile backends", "Static websites"],
-                        "supported_languages": ["C#", "Java", "Node.js", "Python", "PHP", "Ruby"],
-                        "features": ["Auto-scaling", "Custom domains", "SSL certificates", "Deployment slots"]
-                    },
-                    "azure_functions": {
-                        "name": "Azure Functions",
-                        "description": "Event-driven serverless compute platform",
-                        "use_cases": ["Event processing", "Data transformation", "API backends", "Scheduled tasks"],
-                        "triggers": ["HTTP", "Timer", "Blob storage", "Queue", "Event Hub", "Service Bus"],
-                        "pricing": "Pay per execution"
-                    },
-                    "kubernetes_service": {
-                        "name": "Azure Kubernetes Service (AKS)",
-                        "description": "Managed Kubernetes container orchestration",
-                        "use_cases": ["Microservices", "Container orchestration", "CI/CD", "Machine learning workloads"],
-                        "features": ["Auto-scaling", "Azure AD integration", "GPU support", "Virtual nodes"]
-                    },
-                    "container_instances": {
-                        "name": "Container Instances",
-                        "description": "Run containers without managing servers",
-                        "use_cases": ["Batch processing", "Development/testing", "Event-driven applications"],
-                        "features": ["Per-second billing", "Custom sizes", "Persistent storage", "Virtual network integration"]
-                    }
-                }
-            },
-            "storage": {
-                "name": "Storage Services",
-                "description": "Secure, scalable, and durable storage solutions",
-                "services": {
-                    "blob_storage": {
-                        "name": "Blob Storage",
-                        "description": "Object storage for unstructured data",
-                        "use_cases": ["Data backup", "Content distribution", "Data archiving", "Big data analytics"],
-                        "tiers": ["Hot", "Cool", "Archive"],
-                        "types": ["Block blobs", "Append blobs", "Page blobs"]
-                    },
-                    "file_storage": {
-                        "name": "Azure Files",
-                        "description": "Managed file shares in the cloud",
-                        "use_cases": ["Shared application data", "Lift-and-shift scenarios", "Container storage"],
-                        "protocols": ["SMB", "NFS", "REST API"],
-                        "features": ["Snapshot support", "Azure AD authentication", "Encryption"]
-                    },
-                    "data_lake_storage": {
-                        "name": "Data Lake Storage Gen2",
-                        "description": "Massively scalable data lake for big data analytics",
-                        "use_cases": ["Big data analytics", "Data warehousing", "IoT data", "Machine learning"],
-                        "features": ["Hierarchical namespace", "Fine-grained access control", "Analytics optimization"]
-                    }
-                }
-            },
-            "database": {
-                "name": "Database Services",
-                "description": "Fully managed database services",
-                "services": {
-                    "sql_database": {
-                        "name": "Azure SQL Database",
-                        "description": "Managed relational database service",
-                        "use_cases": ["Web applications", "SaaS applications", "Data warehousing"],
-                        "service_tiers": ["Basic", "Standard", "Premium", "General Purpose", "Business Critical"],
-                        "features": ["Automatic tuning", "Threat detection", "Backup and restore", "Geo-replication"]
-                    },
-                    "cosmos_db": {
-                        "name": "Azure Cosmos DB",
-                        "description": "Globally distributed multi-model database",
-                        "use_cases": ["Global applications", "IoT telemetry", "Gaming", "Social media"],
-                        "apis": ["SQL", "MongoDB", "Cassandra", "Gremlin", "Table"],
-                        "features": ["Global distribution", "Multi-master", "Automatic scaling", "SLA guarantees"]
-                    },
-                    "mysql": {
-                        "name": "Azure Database for MySQL",
-                        "description": "Managed MySQL database service",
-                        "use_cases": ["Web applications", "E-commerce", "Content management"],
-                        "versions": ["MySQL 5.6", "MySQL 5.7", "MySQL 8.0"],
-                        "features": ["Automatic backup", "Point-in-time restore", "SSL enforcement", "Advanced threat protection"]
-                    }
-                }
-            },
-            "networking": {
-                "name": "Networking Services",
-                "description": "Connect and secure your cloud resources",
-                "services": {
-                    "virtual_network": {
-                        "name": "Virtual Network",
-                        "description": "Private network in Azure",
-                        "use_cases": ["Resource isolation", "Multi-tier applications", "Hybrid connectivity"],
-                        "features": ["Subnets", "Network security groups", "Route tables", "VNet peering"]
-                    },
-                    "load_balancer": {
-                        "name": "Load Balancer",
-                        "description": "Distribute traffic across multiple resources",
-                        "use_cases": ["High availability", "Scalability", "Traffic distribution"],
-                        "types": ["Basic", "Standard"],
-                        "features": ["Health probes", "Outbound rules", "Multiple frontends", "IPv6 support"]
-                    },
-                    "application_gateway": {
-                        "name": "Application Gateway",
-                        "description": "Layer 7 load balancer with web application firewall",
-                        "use_cases": ["Web applications", "SSL termination", "URL-based routing"],
-                        "features": ["WAF", "SSL offloading", "Cookie-based session affinity", "Multi-site hosting"]
-                    }
-                }
-            },
-            "security": {
-                "name": "Security & Identity",
-                "description": "Secure your applications and data",
-                "services": {
-                    "active_directory": {
-                        "name": "Azure Active Directory",
-                        "description": "Cloud-based identity and access management",
-                        "use_cases": ["Single sign-on", "Multi-factor authentication", "Identity governance"],
-                        "editions": ["Free", "Basic", "Premium P1", "Premium P2"],
-                        "features": ["SSO", "MFA", "Conditional access", "Identity protection"]
-                    },
-                    "key_vault": {
-                        "name": "Azure Key Vault",
-                        "description": "Secure secrets, keys, and certificates",
-                        "use_cases": ["Secret management", "Key management", "Certificate management"],
-                        "features": ["Hardware security modules", "Access policies", "Audit logging", "Network access control"]
-                    }
-                }
-            },
-            "ai_ml": {
-                "name": "AI & Machine Learning",
-                "description": "Build intelligent applications",
-                "services": {
-                    "cognitive_services": {
-                        "name": "Cognitive Services",
-                        "description": "Pre-built AI capabilities",
-                        "categories": ["Vision", "Speech", "Language", "Decision"],
-                        "services": ["Computer Vision", "Speech to Text", "Text Analytics", "Anomaly Detector"],
-                        "use_cases": ["Image recognition", "Speech recognition", "Language understanding", "Content moderation"]
-                    },
-                    "machine_learning": {
-                        "name": "Azure Machine Learning",
-                        "description": "End-to-end machine learning lifecycle",
-                        "use_cases": ["Model development", "Model deployment", "MLOps", "AutoML"],
-                        "features": ["Automated ML", "Designer", "Notebooks", "Model registry", "Endpoints"]
-                    }
-                }
-            }
-        }
+        return _load_catalog()
     
     def list_categories(self) -> List[str]:
         """List all service categories"""
@@ -181,75 +168,156 @@ class AzureResourceExplorer:
         """Get information about a specific category"""
         return self.azure_services.get(category, {})
     
+    def get_category_summary(self, category: str) -> Dict[str, Any]:
+        """Get the name and description of a category without loading its services"""
+        if isinstance(self.azure_services, _LazyCatalog):
+            return self.azure_services.metadata(category)
+        category_data = self.azure_services.get(category, {})
+        return {key: value for key, value in category_data.items() if key != "services"}
+    
     def get_service_info(self, category: str, service: str) -> Dict[str, Any]:
         """Get detailed information about a specific service"""
-        category_data = self.azure_services.get(category, {})
-        services = category_data.get("services", {})
-        return services.get(service, {})
+        if category not in self._flattened_categories:
+            self._flattened_categories.add(category)
+            for service_key, service_data in self.get_category_info(category).get("services", {}).items():
+                self._flat_services[(category, service_key)] = service_data
+        return self._flat_services.get((category, service), {})
+    
+    def _build_entries(self) -> Tuple[ServiceEntry, ...]:
+        """Flatten every catalog service into a ServiceEntry, in catalog order"""
+        return tuple(
+            ServiceEntry(
+                category=category_key,
+                service_key=service_key,
+                category_name=category_data.get("name"),
+                name=service_data.get("name"),
+                description=service_data.get("description"),
+                use_cases=tuple(service_data.get("use_cases", ()))
+            )
+            for category_key, category_data in self.azure_services.items()
+            for service_key, service_data in category_data.get("services", {}).items()
+        )
+    
+    def _build_search_columns(self) -> Dict[str, List[str]]:
+        """Lay out the searchable entry fields as parallel, pre-lowercased columns"""
+        columns = {"name_lc": [], "desc_lc": [], "use_cases_lc": []}
+        for entry in self._entries:
+            columns["name_lc"].append((entry.name or "").lower())
+            columns["desc_lc"].append((entry.description or "").lower())
+            # NUL never appears in typed queries, so joined use cases cannot match across entries
+            columns["use_cases_lc"].append("\0".join(entry.use_cases).lower())
+        return columns
+    
+    def _ensure_search_index(self):
+        """Build the search entries, columns and indexes on first use"""
+        if self._entries is None:
+            self._entries = self._build_entries()
+            self._columns = self._build_search_columns()
+            # One NUL-separated blob per entry lets a single substring test cover every field
+            self._search_blobs = ["\0".join(fields) for fields in
+                                  zip(self._columns["name_lc"], self._columns["desc_lc"], self._columns["use_cases_lc"])]
+    
+    def _find_rows(self, query_lower: str) -> Tuple[int, ...]:
+        """Return the search-column rows matching an already lowercased query"""
+        self._ensure_search_index()
+        return tuple(row for row, blob in enumerate(self._search_blobs) if query_lower in blob)
+    
+    def list_service_names(self) -> List[str]:
+        """List the display names of every service in the catalog"""
+        self._ensure_search_index()
+        return [entry.name for entry in self._entries if entry.name]
     
     def search_services(self, query: str) -> List[Dict[str, Any]]:
         """Search for services by name or description"""
-        results = []
-        query_lower = query.lower()
-        
-        for category_key, category_data in self.azure_services.items():
-            for service_key, service_data in category_data.get("services", {}).items():
-                service_name = service_data.get("name", "").lower()
-                service_desc = service_data.get("description", "").lower()
-                
-                if (query_lower in service_name or 
-                    query_lower in service_desc or
-                    any(query_lower in use_case.lower() for use_case in service_data.get("use_cases", []))):
-                    
-                    results.append({
-                        "category": category_key,
-                        "service_key": service_key,
-                        "name": service_data.get("name"),
-                        "description": service_data.get("description"),
-                        "category_name": category_data.get("name")
-                    })
-        
-        return results
+        return [self._entries[row].to_search_result() for row in self._cached_rows(query.lower())]
+    
+    def search_any(self, terms: Iterable[str]) -> List[Dict[str, Any]]:
+        """Search for services matching any of several terms"""
+        terms = tuple(sorted({term.lower() for term in terms if term}))
+        if not terms:
+            return []
+        self._ensure_search_index()
+        pattern = _compile_terms(terms)
+        return [entry.to_search_result()
+                for entry, blob in zip(self._entries, self._search_blobs)
+                if pattern.search(blob)]
     
     def export_to_json(self, filename: str = "azure_services_catalog.json"):
         """Export the complete catalog to JSON"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.azure_services, f, indent=2, ensure_ascii=False)
+        # Stream the encoder's chunks through a 64 KiB buffer instead of building the whole document
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        # Written beside the target and swapped in, so readers never see a partial export
+        directory = os.path.dirname(os.path.abspath(filename))
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', buffering=1 << 16, dir=directory,
+                                         prefix=".catalog-", suffix=".tmp", delete=False) as f:
+            try:
+                f.writelines(encoder.iterencode(dict(self.azure_services)))
+            except BaseException:
+                f.close()
+                os.remove(f.name)
+                raise
+        # Temp files are private (0600); keep the export's existing mode, or the usual 0644
+        try:
+            mode = os.stat(filename).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(f.name, mode)
+        os.replace(f.name, filename)
         print(f"Azure services catalog exported to {filename}")
 
+MENU_TEXT = """
+Options:
+1. List all categories
+2. Explore a category
+3. Search services
+4. Export catalog to JSON
+5. Exit
+m. Show this menu again"""
+
+def _make_prompt(explorer: AzureResourceExplorer):
+    """Return a prompt(message, complete_services=False) function for the explorer loop"""
+    if PromptSession is None or not sys.stdin.isatty():
+        return lambda message, complete_services=False: input(message)
+    
+    session = PromptSession()
+    # Service names are only resolved when the search prompt first asks for completions
+    completer = WordCompleter(explorer.list_service_names, ignore_case=True, sentence=True)
+    
+    def prompt(message, complete_services=False):
+        return session.prompt(message, completer=completer if complete_services else None)
+    return prompt
+
 def interactive_explorer():
     """Interactive command-line explorer"""
     explorer = AzureResourceExplorer()
+    prompt = _make_prompt(explorer)
     
     print("🌟 Azure Resources Explorer 🌟")
     print("=" * 40)
+    print(MENU_TEXT)
     
     while True:
-        print("\nOptions:")
-        print("1. List all categories")
-        print("2. Explore a category")
-        print("3. Search services")
-        print("4. Export catalog to JSON")
-        print("5. Exit")
+        choice = prompt("\nEnter your choice (1-5, m for menu): ").strip()
         
-        choice = input("\nEnter your choice (1-5): ").strip()
+        if choice == "m":
+            print(MENU_TEXT)
         
-        if choice == "1":
+        elif choice == "1":
             print("\n📂 Azure Service Categories:")
             categories = explorer.list_categories()
             for i, category in enumerate(categories, 1):
-                category_info = explorer.get_category_info(category)
+                category_info = explorer.get_category_summary(category)
                 print(f"{i}. {category_info.get('name', category)} - {category_info.get('description', '')}")
         
         elif choice == "2":
             categories = explorer.list_categories()
             print("\n📂 Select a category:")
             for i, category in enumerate(categories, 1):
-                category_info = explorer.get_category_info(category)
+                category_info = explorer.get_category_summary(category)
                 print(f"{i}. {category_info.get('name', category)}")
             
             try:
-                cat_choice = int(input("Enter category number: ")) - 1
+                cat_choice = int(prompt("Enter category number: ")) - 1
                 if 0 <= cat_choice < len(categories):
                     category = categories[cat_choice]
                     category_info = explorer.get_category_info(category)
@@ -270,9 +338,12 @@ def interactive_explorer():
                 print("Please enter a valid number!")
         
         elif choice == "3":
-            query = input("\n🔍 Enter search term: ").strip()
+            query = prompt("\n🔍 Enter search term (separate several with |): ", complete_services=True).strip()
             if query:
-                results = explorer.search_services(query)
+                if "|" in query:
+                    results = explorer.search_any(term.strip() for term in query.split("|"))
+                else:
+                    results = explorer.search_services(query)
                 if results:
                     print(f"\n📋 Found {len(results)} matching services:")
                     for result in results:
@@ -284,7 +355,7 @@ def interactive_explorer():
                 print("Please enter a search term!")
         
         elif choice == "4":
-            filename = input("Enter filename (default: azure_services_catalog.json): ").strip()
+            filename = prompt("Enter filename (default: azure_services_catalog.json): ").strip()
             if not filename:
                 filename = "azure_services_catalog.json"
             explorer.export_to_json(filename)
@@ -294,7 +365,7 @@ def interactive_explorer():
             break
         
         else:
-            print("Invalid choice! Please enter 1-5.")
+            print("Invalid choice! Please enter 1-5, or m to see the menu.")
 
 if __name__ == "__main__":
     interactive_explorer()
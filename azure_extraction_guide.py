@@ -4,46 +4,65 @@ Azure Architecture Extraction - Complete Usage Guide
 Comprehensive guide for extracting and analyzing Azure architecture
 """
 
-def show_main_menu():
-    """Display the main extraction menu"""
-    
-    print("🌟" + "="*80 + "🌟")
-    print("             AZURE ARCHITECTURE EXTRACTION TOOLKIT")
-    print("🌟" + "="*80 + "🌟")
-    print()
-    print("🎯 Choose your extraction goal:")
-    print()
-    print("   1. 🏗️  Extract Complete Architecture")
-    print("      └─ Get visual diagram of all your Azure resources")
-    print()
-    print("   2. 🔒 Security & Dependencies Analysis") 
-    print("      └─ Analyze network topology and security configuration")
-    print()
-    print("   3. 💰 Cost Optimization Analysis")
-    print("      └─ Get personalized cost optimization recommendations")
-    print()
-    print("   4. 📊 Export Resource Data (JSON)")
-    print("      └─ Export complete resource inventory for automation")
-    print()
-    print("   5. 🔍 Interactive Resource Explorer")
-    print("      └─ Browse and search your Azure resources")
-    print()
-    print("   6. 📚 View Azure Services Reference")
-    print("      └─ Browse all available Azure services and patterns")
-    print()
-    print("   7. ⚙️  Setup & Prerequisites Check")
-    print("      └─ Install Azure CLI and authenticate")
-    print()
-    print("   8. 📖 Help & Documentation")
-    print("      └─ View detailed usage instructions")
-    print()
-    print("   0. 🚪 Exit")
-    print()
+import asyncio
+import os
+import subprocess
+import sys
 
-def show_help_documentation():
-    """Show detailed help and documentation"""
-    
-    help_text = """
+# The toolkit scripts are imported so menu actions run in this interpreter
+# instead of paying a fresh Python start-up per action
+try:
+    from azure_architecture_extractor import main as run_architecture_extractor
+except ImportError:
+    run_architecture_extractor = None
+
+try:
+    from azure_dependency_analyzer import main as run_dependency_analyzer
+except ImportError:
+    run_dependency_analyzer = None
+
+try:
+    from azure_main_menu import main as run_services_menu
+except ImportError:
+    run_services_menu = None
+
+_BANNER = "🌟" + "="*80 + "🌟"
+
+MAIN_MENU_TEXT = f"""{_BANNER}
+             AZURE ARCHITECTURE EXTRACTION TOOLKIT
+{_BANNER}
+
+🎯 Choose your extraction goal:
+
+   1. 🏗️  Extract Complete Architecture
+      └─ Get visual diagram of all your Azure resources
+
+   2. 🔒 Security & Dependencies Analysis
+      └─ Analyze network topology and security configuration
+
+   3. 💰 Cost Optimization Analysis
+      └─ Get personalized cost optimization recommendations
+
+   4. 📊 Export Resource Data (JSON)
+      └─ Export complete resource inventory for automation
+
+   5. 🔍 Interactive Resource Explorer
+      └─ Browse and search your Azure resources
+
+   6. 📚 View Azure Services Reference
+      └─ Browse all available Azure services and patterns
+
+   7. ⚙️  Setup & Prerequisites Check
+      └─ Install Azure CLI and authenticate
+
+   8. 📖 Help & Documentation
+      └─ View detailed usage instructions
+
+   0. 🚪 Exit
+
+"""
+
+HELP_TEXT = """
 📖 AZURE ARCHITECTURE EXTRACTION - DETAILED HELP
 
 🎯 OVERVIEW
@@ -237,51 +256,105 @@ The JSON exports can be integrated with:
 4. Document security improvements
 5. Regular security posture reviews
 """
+
+_MAIN_MENU_BYTES = MAIN_MENU_TEXT.encode("utf-8")
+_HELP_BYTES = (HELP_TEXT + "\n").encode("utf-8")
+
+def _write_prerendered(data: bytes):
+    """Write pre-encoded UTF-8 text to stdout in one call"""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text-only stream
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    buffer.write(data)
+    buffer.flush()
+
+def show_main_menu():
+    """Display the main extraction menu"""
+    _write_prerendered(_MAIN_MENU_BYTES)
+
+def show_help_documentation():
+    """Show detailed help and documentation"""
+    _write_prerendered(_HELP_BYTES)
+
+# (script, progress label, success message, failure label) for each workflow step
+EXTRACTION_STEPS = (
+    ('azure_architecture_extractor.py', "1. 🏗️  Extracting architecture...",
+     "Architecture extraction completed", "Architecture extraction"),
+    ('azure_dependency_analyzer.py', "2. 🔒 Analyzing dependencies and security...",
+     "Security analysis completed", "Security analysis"),
+)
+
+async def _run_script(script):
+    """Run a Python script in a child process, relaying its output line by line"""
+    process = await asyncio.create_subprocess_exec(
+        'python3', script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        # Piped children block-buffer stdout; unbuffered output arrives as it is printed
+        env={**os.environ, "PYTHONUNBUFFERED": "1"}
+    )
+    prefix = os.path.splitext(script)[0]
+    
+    def relay_line(line):
+        print(f"   [{prefix}] {line.decode(errors='replace').rstrip()}")
+    
+    async def relay_stdout():
+        # Fixed-size reads have no line-length limit; a partial last line carries into the next chunk
+        tail = b""
+        while True:
+            chunk = await process.stdout.read(1 << 16)
+            if not chunk:
+                break
+            *lines, tail = (tail + chunk).split(b"\n")
+            for line in lines:
+                relay_line(line)
+        if tail:
+            relay_line(tail)
     
-    print(help_text)
+    try:
+        _, stderr = await asyncio.gather(relay_stdout(), process.stderr.read())
+        await process.wait()
+    finally:
+        # Never leave the child running if relaying failed or was cancelled
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return process.returncode, stderr.decode(errors='replace')
+
+async def _run_scripts_concurrently(scripts):
+    """Run independent scripts side by side; failures are returned, not raised"""
+    return await asyncio.gather(*(_run_script(script) for script in scripts),
+                                return_exceptions=True)
 
 def run_extraction_workflow():
     """Run the complete extraction workflow"""
-    import subprocess
-    import os
-    
     print("🚀 Starting complete Azure architecture extraction...")
     print("="*60)
     
     # Check if scripts exist
-    scripts = [
-        'azure_architecture_extractor.py',
-        'azure_dependency_analyzer.py'
-    ]
+    scripts = [script for script, _, _, _ in EXTRACTION_STEPS]
     
     for script in scripts:
         if not os.path.exists(script):
             print(f"❌ Script not found: {script}")
             return
     
-    print("1. 🏗️  Extracting architecture...")
-    try:
-        result = subprocess.run(['python3', 'azure_architecture_extractor.py'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("   ✅ Architecture extraction completed")
-        else:
-            print(f"   ❌ Architecture extraction failed: {result.stderr}")
-            return
-    except Exception as e:
-        print(f"   ❌ Error running architecture extractor: {e}")
-        return
+    # The extractor and the analyzer write different files and only read
+    # from Azure, so both run at the same time
+    for _, label, _, _ in EXTRACTION_STEPS:
+        print(label)
+    results = asyncio.run(_run_scripts_concurrently(scripts))
     
-    print("\n2. 🔒 Analyzing dependencies and security...")
-    try:
-        result = subprocess.run(['python3', 'azure_dependency_analyzer.py'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("   ✅ Security analysis completed")
+    print()
+    for (script, _, success, failure), result in zip(EXTRACTION_STEPS, results):
+        if isinstance(result, Exception):
+            print(f"   ❌ Error running {script}: {result}")
+        elif result[0] == 0:
+            print(f"   ✅ {success}")
         else:
-            print(f"   ❌ Security analysis failed: {result.stderr}")
-    except Exception as e:
-        print(f"   ❌ Error running dependency analyzer: {e}")
+            print(f"   ❌ {failure} failed: {result[1]}")
     
     print("\n🎉 Extraction workflow completed!")
     print("\n📁 Generated files:")
@@ -290,6 +363,14 @@ def run_extraction_workflow():
     print("   • azure_comprehensive_analysis.txt")
     print("   • azure_architecture_export_*.json")
 
+def _run_in_process(entry_point, script):
+    """Call a toolkit script's main() in this process; False if the script is missing"""
+    if entry_point is None:
+        print(f"❌ Script not found: {script}")
+        return False
+    entry_point()
+    return True
+
 def main():
     """Main menu loop"""
     
@@ -309,40 +390,35 @@ def main():
                 
             elif choice == "2":
                 print("\n🔒 Starting security and dependencies analysis...")
-                import subprocess
-                subprocess.run(['python3', 'azure_dependency_analyzer.py'])
+                _run_in_process(run_dependency_analyzer, "azure_dependency_analyzer.py")
                 
             elif choice == "3":
                 print("\n💰 Starting cost optimization analysis...")
-                import subprocess
-                subprocess.run(['python3', 'azure_architecture_extractor.py'])
-                print("💡 Review the azure_cost_optimization_guide.txt file for recommendations")
+                if _run_in_process(run_architecture_extractor, "azure_architecture_extractor.py"):
+                    print("💡 Review the azure_cost_optimization_guide.txt file for recommendations")
                 
             elif choice == "4":
                 print("\n📊 Exporting resource data to JSON...")
-                import subprocess
-                subprocess.run(['python3', 'azure_architecture_extractor.py'])
-                print("💾 JSON export completed - check azure_architecture_export_*.json")
+                if _run_in_process(run_architecture_extractor, "azure_architecture_extractor.py"):
+                    print("💾 JSON export completed - check azure_architecture_export_*.json")
                 
             elif choice == "5":
                 print("\n🔍 Starting interactive resource explorer...")
-                try:
-                    import subprocess
-                    subprocess.run(['python3', 'azure_main_menu.py'])
-                except FileNotFoundError:
+                if run_services_menu is None:
                     print("❌ Azure explorer not found. Please ensure all files are present.")
+                else:
+                    run_services_menu()
                 
             elif choice == "6":
                 print("\n📚 Opening Azure Services Reference...")
-                try:
-                    import subprocess
-                    subprocess.run(['python3', 'azure_main_menu.py'])
-                except FileNotFoundError:
+                if run_services_menu is None:
                     print("❌ Azure services reference not found.")
+                else:
+                    run_services_menu()
                 
             elif choice == "7":
                 print("\n⚙️  Running setup and prerequisites check...")
-                import subprocess
+                # A shell script, so it still needs its own process
                 subprocess.run(['./setup_azure_extraction.sh'])
                 
             elif choice == "8":
@@ -3,281 +3,272 @@
 Azure Resources Setup and Usage Guide
 """
 
-def display_menu():
-    """Display the main menu with available options"""
-    
-    print("🌟" + "="*80 + "🌟")
-    print("        AZURE RESOURCES DIAGRAM GENERATOR - COMPLETE SUITE")
-    print("🌟" + "="*80 + "🌟")
-    print()
-    print("📁 Generated Files:")
-    print("   ├── 📊 azure_diagrams/azure_resources_comprehensive_guide.txt")
-    print("   ├── 📋 azure_diagrams/azure_service_selection_matrix.txt") 
-    print("   ├── 🎨 azure_diagrams/azure_ascii_diagram.txt")
-    print("   ├── 📚 azure_services_catalog.json")
-    print("   └── 📖 README.md")
-    print()
-    print("🚀 Available Tools:")
-    print("   1. 📖 View Comprehensive Azure Guide")
-    print("   2. 🎨 View ASCII Diagram")
-    print("   3. 📋 View Service Selection Matrix")
-    print("   4. 🔍 Interactive Azure Explorer")
-    print("   5. 📊 Export Services Catalog (JSON)")
-    print("   6. 💡 Show Quick Tips")
-    print("   7. 🏗️  Show Architecture Examples")
-    print("   8. 💰 Show Cost Optimization Tips")
-    print("   9. 🔧 Generate Additional Diagrams")
-    print("   0. 🚪 Exit")
-    print()
+import importlib
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-def show_quick_tips():
-    """Display quick tips for Azure usage"""
-    
-    tips = """
-💡 AZURE QUICK TIPS & BEST PRACTICES
+# Static screens are generated from menu_spec.json by build_menu_text.py
+from _generated_text import ARCH, COST, MENU, TIPS
 
-🏷️  NAMING CONVENTIONS:
-   - Use consistent naming: rg-prod-eastus-001
-   - Include environment: dev, test, prod
-   - Include location: eastus, westeurope
-   - Include purpose: web, db, storage
+# Piped or scripted sessions (or AZMENU_NOPAUSE=1) skip the pause between actions
+_INTERACTIVE = sys.stdin.isatty() and not os.environ.get("AZMENU_NOPAUSE")
 
-🔒 SECURITY BEST PRACTICES:
-   - Always use Azure AD for authentication
-   - Store secrets in Key Vault
-   - Enable MFA for all accounts
-   - Use Network Security Groups
-   - Regular security reviews with Security Center
+_SEP = "="*100
 
-💰 COST OPTIMIZATION:
-   - Use Reserved Instances for predictable workloads (up to 72% savings)
-   - Implement auto-scaling to match demand
-   - Use Azure Spot VMs for fault-tolerant workloads (up to 90% savings)
-   - Regular resource right-sizing
-   - Set up cost alerts and budgets
+# Pre-encoded once so repeated views skip the text layer's encode step
+_BLOBS = {
+    "menu": MENU.encode("utf-8"),
+    "tips": TIPS.encode("utf-8"),
+    "arch": ARCH.encode("utf-8"),
+    "cost": COST.encode("utf-8"),
+}
 
-📊 MONITORING & PERFORMANCE:
-   - Enable Application Insights for all applications
-   - Set up Azure Monitor dashboards
-   - Use Log Analytics for centralized logging
-   - Configure alerts for critical metrics
-   - Regular performance reviews
+# Built on first export so startup stays free of the azure_explorer import
+_explorer_singleton = None
+_export_thread: Optional[threading.Thread] = None
 
-🏗️  ARCHITECTURE PRINCIPLES:
-   - Design for failure (availability zones)
-   - Use managed services when possible
-   - Implement proper backup strategies
-   - Plan for disaster recovery
-   - Use Infrastructure as Code (ARM, Terraform)
-"""
-    
-    print(tips)
+CATALOG_EXPORT = "azure_services_catalog.json"
+_TOOLKIT_DIR = Path(__file__).parent
 
-def show_architecture_examples():
-    """Display common architecture patterns"""
-    
-    architectures = """
-🏗️  COMMON AZURE ARCHITECTURES
+# Viewed guide files kept as bytes and reread only when their mtime or size changes;
+# holding bytes rather than an open mapping leaves the files free to be rewritten
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+_VIEW_CHUNK = 1 << 16
 
-📱 BASIC WEB APPLICATION:
-   Internet → Azure Front Door → App Service → Azure SQL Database
-                                    ↓
-                              Azure Blob Storage (for static content)
-   
-   Cost: ~$100-500/month
-   Use cases: Small to medium websites, APIs
+def _cached_file(path: str) -> bytes:
+    """Return a file's bytes, reading it again only if it changed since the last view"""
+    st = os.stat(path)
+    version = (st.st_mtime_ns, st.st_size)
+    entry = _FILE_CACHE.get(path)
+    if entry is None or entry[0] != version:
+        with open(path, "rb") as f:
+            entry = (version, f.read())
+        _FILE_CACHE[path] = entry
+    return entry[1]
 
-🐳 MICROSERVICES ARCHITECTURE:
-   Internet → API Management → Azure Kubernetes Service (AKS)
-                                        ↓
-                              Azure Service Bus ← → Cosmos DB
-                                        ↓              ↓
-                                Redis Cache        Event Grid
-   
-   Cost: ~$500-2000/month
-   Use cases: Large applications, high scalability needs
+def _write_cached(path: str):
+    """Stream a file's cached bytes to stdout in 64 KB writes, as stored on disk"""
+    data = _cached_file(path)
+    if not data:
+        return
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text-only stream
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    view = memoryview(data)
+    for start in range(0, len(view), _VIEW_CHUNK):
+        buffer.write(view[start:start + _VIEW_CHUNK])
+    buffer.flush()
 
-⚡ SERVERLESS ARCHITECTURE:
-   Event Grid → Azure Functions → Cosmos DB
-        ↓              ↓              ↓
-   Logic Apps → Storage Queue → Table Storage
-   
-   Cost: Pay-per-execution (very low for sporadic usage)
-   Use cases: Event-driven apps, batch processing
+@lru_cache(maxsize=None)
+def _load_entry(module: str, attr: str = "main"):
+    """Import a toolkit script once and return its entry point, or None if unavailable"""
+    try:
+        return getattr(importlib.import_module(module), attr)
+    except ImportError:
+        return None
 
-📊 BIG DATA ANALYTICS:
-   IoT Devices → Event Hubs → Stream Analytics → Data Lake Storage Gen2
-                                     ↓                    ↓
-                              Cosmos DB           Synapse Analytics
-                                     ↓                    ↓
-                            Machine Learning       Power BI Dashboard
-   
-   Cost: ~$1000-5000/month
-   Use cases: Real-time analytics, IoT data processing
+def _run_tool(module: str, attr: str = "main") -> bool:
+    """Run a toolkit script in this process, falling back to a child interpreter; True on success"""
+    entry_point = _load_entry(module, attr)
+    if entry_point is not None:
+        entry_point()
+        return True
+    result = subprocess.run([sys.executable, f"{module}.py"], check=False)
+    if result.returncode != 0:
+        print(f"❌ {module}.py exited with status {result.returncode}")
+    return result.returncode == 0
 
-🎮 GAMING BACKEND:
-   Game Clients → Traffic Manager → App Service (multiple regions)
-                                          ↓
-                     Redis Cache ← → Cosmos DB (globally distributed)
-                                          ↓
-                               Azure Functions (game logic)
-   
-   Cost: ~$300-1500/month
-   Use cases: Mobile games, multiplayer games
+def _emit(key: str):
+    """Write one of the pre-encoded static screens to stdout in one call"""
+    data = _BLOBS[key]
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text-only stream
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    buffer.write(data)
+    buffer.flush()
 
-🔒 ENTERPRISE SECURITY:
-   On-premises → ExpressRoute → Azure Virtual Network
-                                        ↓
-                    Azure AD ← → Key Vault ← → Security Center
-                        ↓              ↓              ↓
-                 Conditional      Secrets &     Threat Detection
-                   Access       Certificates
-   
-   Cost: ~$200-1000/month
-   Use cases: Enterprise applications, compliance requirements
-"""
-    
-    print(architectures)
+def _view_file(heading: str, path: str, missing: str):
+    """Print a generated text file, or a hint on how to create it"""
+    print(heading)
+    try:
+        _write_cached(path)
+    except FileNotFoundError:
+        print(missing)
 
-def show_cost_optimization():
-    """Display cost optimization strategies"""
-    
-    cost_tips = """
-💰 AZURE COST OPTIMIZATION STRATEGIES
+def _view_guide():
+    """Show the comprehensive Azure guide"""
+    _view_file("\n📖 Opening Comprehensive Azure Guide...",
+               "azure_diagrams/azure_resources_comprehensive_guide.txt",
+               "❌ Guide file not found. Please run: python azure_diagram_simplified.py")
 
-🎯 COMPUTE OPTIMIZATION:
-   • Reserved Instances: 1-3 year commitments save up to 72%
-   • Azure Spot VMs: Use spare capacity for up to 90% savings
-   • Auto-scaling: Scale resources based on demand
-   • Right-sizing: Regular review and adjust VM sizes
-   • B-series VMs: For variable workloads with CPU bursting
+def _view_ascii_diagram():
+    """Show the ASCII architecture diagram"""
+    _view_file("\n🎨 Opening ASCII Diagram...",
+               "azure_diagrams/azure_ascii_diagram.txt",
+               "❌ ASCII diagram not found. Please run: python create_ascii_diagram.py")
 
-💾 STORAGE OPTIMIZATION:
-   • Lifecycle Management: Auto-move data to cooler tiers
-   • Hot Tier: Frequently accessed data
-   • Cool Tier: Infrequently accessed (30+ days) - 50% cheaper
-   • Archive Tier: Rarely accessed (180+ days) - 80% cheaper
-   • Data Deduplication: Reduce redundant data
+def _view_matrix():
+    """Show the service selection matrix"""
+    _view_file("\n📋 Opening Service Selection Matrix...",
+               "azure_diagrams/azure_service_selection_matrix.txt",
+               "❌ Matrix file not found. Please run: python azure_diagram_simplified.py")
 
-🗄️  DATABASE OPTIMIZATION:
-   • Azure SQL Database: Use appropriate service tier
-   • Serverless: Auto-pause for development databases
-   • Read Replicas: Offload read operations
-   • Elastic Pools: Share resources across databases
-   • Reserved Capacity: For predictable workloads
+def _start_explorer():
+    """Run the interactive Azure explorer"""
+    print("\n🔍 Starting Interactive Azure Explorer...")
+    try:
+        _run_tool("azure_explorer", "interactive_explorer")
+    except EOFError:
+        # Piped input ran out inside the explorer; the menu's next prompt sees EOF and exits
+        print()
+    except OSError as e:
+        print(f"❌ Error starting explorer: {e}")
 
-🌐 NETWORKING OPTIMIZATION:
-   • CDN: Reduce bandwidth costs and improve performance
-   • ExpressRoute: For large data transfers vs. VPN
-   • Traffic Manager: Route to least expensive regions
-   • Private Endpoints: Reduce data transfer costs
+def _catalog_sources_mtime() -> float:
+    """Newest modification time of the explorer module and its catalog files"""
+    sources = [_TOOLKIT_DIR / "azure_explorer.py", *(_TOOLKIT_DIR / "catalog").glob("*.json")]
+    return max(path.stat().st_mtime for path in sources if path.exists())
 
-📊 MONITORING & GOVERNANCE:
-   • Azure Cost Management: Set budgets and alerts
-   • Azure Advisor: Get personalized recommendations
-   • Resource Tags: Track costs by project/department
-   • Azure Policy: Enforce cost controls
-   • Regular Reviews: Monthly cost analysis
+# Expected failures of a catalog export: missing module, unwritable file, corrupt catalog data
+_EXPORT_ERRORS = (ImportError, OSError, json.JSONDecodeError)
 
-💡 PRO TIPS:
-   • Use Azure Pricing Calculator for estimates
-   • Take advantage of Azure Credits (Visual Studio, MSDN)
-   • Consider Azure Dev/Test pricing for non-production
-   • Use Azure Migrate for cost-effective cloud migration planning
-   • Implement Infrastructure as Code for consistent deployments
+def _run_export():
+    """Write the catalog export with the shared explorer instance"""
+    global _explorer_singleton
+    if _explorer_singleton is None:
+        from azure_explorer import AzureResourceExplorer
+        _explorer_singleton = AzureResourceExplorer()
+    _explorer_singleton.export_to_json(CATALOG_EXPORT)
 
-📈 COST ESTIMATION EXAMPLES:
-   Small Business:     $100-500/month
-   Medium Enterprise:  $1,000-5,000/month  
-   Large Enterprise:   $10,000-50,000/month
-   Global Enterprise:  $100,000+/month
-"""
-    
-    print(cost_tips)
+def _refresh_export():
+    """Background wrapper for _run_export that reports instead of raising"""
+    try:
+        _run_export()
+    except Exception as e:  # nothing above this thread would report it, so report everything
+        print(f"❌ Error refreshing catalog: {e}")
+
+def _export_catalog():
+    """Export the services catalog to JSON, reusing an existing export where possible"""
+    global _export_thread
+    print("\n📊 Exporting Services Catalog...")
+    try:
+        try:
+            export_mtime = os.stat(CATALOG_EXPORT).st_mtime
+        except FileNotFoundError:
+            _run_export()
+            return
+        
+        if export_mtime >= _catalog_sources_mtime():
+            print(f"✅ {CATALOG_EXPORT} is already up to date")
+            return
+        
+        # Stale export: hand it out now and rebuild it off the menu thread
+        age = time.time() - export_mtime
+        print(f"♻️  Using cached catalog (age: {age:.0f}s). Refreshing in background...")
+        if _export_thread is None or not _export_thread.is_alive():
+            _export_thread = threading.Thread(target=_refresh_export, name="catalog-export")
+            _export_thread.start()
+    except _EXPORT_ERRORS as e:
+        print(f"❌ Error exporting catalog: {e}")
+
+def _capture_tool(module: str) -> Tuple[int, str]:
+    """Run a toolkit script in a child interpreter and return its exit status and combined output"""
+    result = subprocess.run([sys.executable, f"{module}.py"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            env={**os.environ, "PYTHONIOENCODING": "utf-8"}, check=False)
+    return result.returncode, result.stdout.decode("utf-8", errors="replace")
+
+_DIAGRAM_TOOLS = ("azure_diagram_simplified", "create_ascii_diagram")
+
+def _generate_diagrams():
+    """Regenerate the guide, matrix and ASCII diagram files"""
+    print("\n🔧 Generating Additional Diagrams...")
+    try:
+        # The two generators write separate files, so they run side by side as child
+        # processes; their output is captured and shown one tool at a time
+        with ThreadPoolExecutor(max_workers=len(_DIAGRAM_TOOLS)) as pool:
+            results = list(pool.map(_capture_tool, _DIAGRAM_TOOLS))
+        succeeded = True
+        for module, (returncode, output) in zip(_DIAGRAM_TOOLS, results):
+            sys.stdout.write(output)
+            if returncode != 0:
+                print(f"❌ {module}.py exited with status {returncode}")
+                succeeded = False
+        if succeeded:
+            print("✅ Additional diagrams generated!")
+    except OSError as e:
+        print(f"❌ Error generating diagrams: {e}")
+
+# Menu actions indexed by choice number; exit (0) and menu redraw are handled by the loop
+_HANDLERS = (
+    None,
+    _view_guide,
+    _view_ascii_diagram,
+    _view_matrix,
+    _start_explorer,
+    _export_catalog,
+    partial(_emit, "tips"),
+    partial(_emit, "arch"),
+    partial(_emit, "cost"),
+    _generate_diagrams,
+)
+_ACTION_CHOICES = frozenset("123456789")
+
+def _buffer_piped_stdin():
+    """Read piped input in one call; the menu and the tools it runs then consume it from memory"""
+    if sys.stdin is not None and not sys.stdin.isatty():
+        sys.stdin = io.StringIO(sys.stdin.read())
 
 def main():
     """Main interactive menu"""
+    _buffer_piped_stdin()
     
+    # The menu is static, so it is only redrawn when the user asks for it
+    dirty = True
     while True:
-        display_menu()
+        if dirty:
+            _emit("menu")
+            dirty = False
         
         try:
-            choice = input("🎯 Enter your choice (0-9): ").strip()
+            try:
+                choice = input("🎯 Enter your choice (0-9, m for menu): ").strip()
+            except EOFError:
+                choice = "0"  # end of piped input
             
             if choice == "0":
-                print("\n👋 Thank you for using Azure Resources Diagram Generator!")
-                print("📚 Don't forget to check the generated files in the azure_diagrams/ directory")
+                sys.stdout.write("\n👋 Thank you for using Azure Resources Diagram Generator!\n"
+                                 "📚 Don't forget to check the generated files in the azure_diagrams/ directory\n")
                 break
                 
-            elif choice == "1":
-                print("\n📖 Opening Comprehensive Azure Guide...")
-                try:
-                    with open("azure_diagrams/azure_resources_comprehensive_guide.txt", "r") as f:
-                        print(f.read())
-                except FileNotFoundError:
-                    print("❌ Guide file not found. Please run: python azure_diagram_simplified.py")
-                    
-            elif choice == "2":
-                print("\n🎨 Opening ASCII Diagram...")
-                try:
-                    with open("azure_diagrams/azure_ascii_diagram.txt", "r") as f:
-                        print(f.read())
-                except FileNotFoundError:
-                    print("❌ ASCII diagram not found. Please run: python create_ascii_diagram.py")
-                    
-            elif choice == "3":
-                print("\n📋 Opening Service Selection Matrix...")
-                try:
-                    with open("azure_diagrams/azure_service_selection_matrix.txt", "r") as f:
-                        print(f.read())
-                except FileNotFoundError:
-                    print("❌ Matrix file not found. Please run: python azure_diagram_simplified.py")
-                    
-            elif choice == "4":
-                print("\n🔍 Starting Interactive Azure Explorer...")
-                try:
-                    import subprocess
-                    subprocess.run(["python", "azure_explorer.py"])
-                except Exception as e:
-                    print(f"❌ Error starting explorer: {e}")
-                    
-            elif choice == "5":
-                print("\n📊 Exporting Services Catalog...")
-                try:
-                    from azure_explorer import AzureResourceExplorer
-                    explorer = AzureResourceExplorer()
-                    explorer.export_to_json()
-                except Exception as e:
-                    print(f"❌ Error exporting catalog: {e}")
-                    
-            elif choice == "6":
-                show_quick_tips()
-                
-            elif choice == "7":
-                show_architecture_examples()
-                
-            elif choice == "8":
-                show_cost_optimization()
-                
-            elif choice == "9":
-                print("\n🔧 Generating Additional Diagrams...")
-                try:
-                    import subprocess
-                    subprocess.run(["python", "azure_diagram_simplified.py"])
-                    subprocess.run(["python", "create_ascii_diagram.py"])
-                    print("✅ Additional diagrams generated!")
-                except Exception as e:
-                    print(f"❌ Error generating diagrams: {e}")
-                    
+            if choice.lower() == "m":
+                dirty = True
+                continue
+            
+            if choice in _ACTION_CHOICES:
+                _HANDLERS[int(choice)]()
             else:
-                print("❌ Invalid choice. Please enter 0-9.")
+                print("❌ Invalid choice. Please enter 0-9, or m to see the menu.")
                 
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")
             break
             
-        input("\n📖 Press Enter to continue...")
-        print("\n" + "="*100 + "\n")
+        if _INTERACTIVE:
+            input("\n📖 Press Enter to continue...")
+            print(f"\n{_SEP}\n")
 
 if __name__ == "__main__":
     main()
@@ -4,20 +4,78 @@ Modern Azure Architecture PNG Diagram Generator
 Creates beautiful, modern PNG diagrams from Azure architecture data
 """
 
+import hashlib
 import json
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, ConnectionPatch
-import numpy as np
+import multiprocessing
 from datetime import datetime
 import os
+import sys
 from typing import Dict, List, Any, Tuple
-from collections import defaultdict
-import seaborn as sns
+from collections import Counter, defaultdict
 
-# Set modern style
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib parser works too
+    orjson = None
+
+# numpy, matplotlib and seaborn are imported by _init_matplotlib() when the first diagram is drawn
+np = None
+plt = None
+FancyBboxPatch = None
+FontProperties = None
+PatchCollection = None
+to_rgba = None
+
+def _init_matplotlib():
+    """Import numpy, matplotlib and seaborn and apply the diagram style, once"""
+    global np, plt, FancyBboxPatch, FontProperties, PatchCollection, to_rgba
+    if plt is not None:
+        return
+    
+    import numpy
+    import matplotlib
+    matplotlib.use('Agg')  # PNG output only, no GUI backend needed
+    import matplotlib.pyplot as pyplot
+    import seaborn as sns
+    from matplotlib.collections import PatchCollection as patch_collection
+    from matplotlib.colors import to_rgba as color_to_rgba
+    from matplotlib.font_manager import FontProperties as font_properties
+    from matplotlib.patches import FancyBboxPatch as fancy_bbox_patch
+    
+    # Set modern style; 'fast' adds path simplification and chunked Agg paths
+    pyplot.style.use(['seaborn-v0_8', 'fast'])
+    # Labels are plain resource names, never mathtext; also keeps a '$' in a name literal
+    pyplot.rcParams['text.parse_math'] = False
+    sns.set_palette("husl")
+    
+    np = numpy
+    FancyBboxPatch, FontProperties = fancy_bbox_patch, font_properties
+    PatchCollection, to_rgba = patch_collection, color_to_rgba
+    plt = pyplot
+
+# Diagrams render in forked workers where fork is the safe default (Linux)
+_CAN_FORK = sys.platform.startswith('linux')
+_FORK_GENERATOR = None
+
+def _render_forked(method: str, output_file: str):
+    """Worker entry point: draw one diagram with the generator inherited from the parent"""
+    return getattr(_FORK_GENERATOR, method)(output_file)
+
+# Fast zlib level for PNG encoding; files are slightly larger but save much quicker
+_PNG_PIL_KWARGS = {'compress_level': 1, 'optimize': False}
+
+# Resource provider namespaces per diagram category
+SERVICE_TYPE_MAPPING = {
+    'compute': ['microsoft.compute', 'microsoft.containerservice', 'microsoft.containerinstance', 'microsoft.web'],
+    'storage': ['microsoft.storage'],
+    'database': ['microsoft.sql', 'microsoft.documentdb', 'microsoft.dbformysql', 'microsoft.dbforpostgresql', 'microsoft.cache'],
+    'network': ['microsoft.network'],
+    'security': ['microsoft.keyvault', 'microsoft.security'],
+    'analytics': ['microsoft.synapse', 'microsoft.datafactory', 'microsoft.databricks', 'microsoft.streamanalytics'],
+    'ai_ml': ['microsoft.cognitiveservices', 'microsoft.machinelearningservices'],
+    'integration': ['microsoft.logic', 'microsoft.servicebus', 'microsoft.eventgrid', 'microsoft.eventhub'],
+    'monitoring': ['microsoft.insights', 'microsoft.operationalinsights']
+}
 
 class ModernAzureDiagramGenerator:
     """Generate modern, beautiful PNG diagrams of Azure architecture"""
@@ -39,20 +97,43 @@ class ModernAzureDiagramGenerator:
             'text': '#323130',         # Dark Gray
             'border': '#D2D0CE'        # Medium Gray
         }
+        self._rgba = None  # RGBA palette, resolved when the first figure is prepared
+        self._rgba_fallback = None
+        self._fonts = None
+        self._categories = None
+        self._input_hash = None  # BLAKE2b digest of the loaded export
+        self._ns_to_category = {ns: category for category, namespaces in SERVICE_TYPE_MAPPING.items()
+                                for ns in namespaces}
         self.load_architecture_data()
     
     def load_architecture_data(self):
         """Load architecture data from JSON file"""
         try:
-            with open(self.architecture_file, 'r', encoding='utf-8') as f:
-                self.architecture_data = json.load(f)
+            with open(self.architecture_file, 'rb') as f:
+                data = f.read()
+            self._input_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+            self.architecture_data = orjson.loads(data) if orjson is not None else json.loads(data)
+            self._annotate_short_types()
             print(f"✅ Loaded architecture data: {self.architecture_data['metadata']['total_resources']} resources")
         except Exception as e:
             print(f"❌ Error loading architecture data: {e}")
             self.architecture_data = {}
+            self._input_hash = None
+        self._categories = None
+    
+    def _annotate_short_types(self):
+        """Store each resource's type suffix (e.g. virtualMachines) once as '_short_type'"""
+        resources = self.architecture_data.get('resources', {})
+        for index in ('by_type', 'by_resource_group'):
+            for resource_list in resources.get(index, {}).values():
+                for resource in resource_list:
+                    resource['_short_type'] = resource.get('type', '').rsplit('/', 1)[-1]
     
     def categorize_resources(self) -> Dict[str, List]:
-        """Categorize resources by service type"""
+        """Categorize resources by service type, computed once per loaded file"""
+        if self._categories is not None:
+            return self._categories
+        
         categories = {
             'compute': [],
             'storage': [],
@@ -67,42 +148,75 @@ class ModernAzureDiagramGenerator:
         }
         
         if 'resources' not in self.architecture_data or 'by_type' not in self.architecture_data['resources']:
+            self._categories = categories
             return categories
         
-        type_mapping = {
-            'compute': ['microsoft.compute', 'microsoft.containerservice', 'microsoft.containerinstance', 'microsoft.web'],
-            'storage': ['microsoft.storage'],
-            'database': ['microsoft.sql', 'microsoft.documentdb', 'microsoft.dbformysql', 'microsoft.dbforpostgresql', 'microsoft.cache'],
-            'network': ['microsoft.network'],
-            'security': ['microsoft.keyvault', 'microsoft.security'],
-            'analytics': ['microsoft.synapse', 'microsoft.datafactory', 'microsoft.databricks', 'microsoft.streamanalytics'],
-            'ai_ml': ['microsoft.cognitiveservices', 'microsoft.machinelearningservices'],
-            'integration': ['microsoft.logic', 'microsoft.servicebus', 'microsoft.eventgrid', 'microsoft.eventhub'],
-            'monitoring': ['microsoft.insights', 'microsoft.operationalinsights']
-        }
-        
         for resource_type, resources in self.architecture_data['resources']['by_type'].items():
-            resource_type_lower = resource_type.lower()
-            categorized = False
-            
-            for category, keywords in type_mapping.items():
-                if any(keyword in resource_type_lower for keyword in keywords):
-                    categories[category].extend(resources)
-                    categorized = True
-                    break
-            
-            if not categorized:
-                categories['other'].extend(resources)
+            namespace = resource_type.lower().split('/', 1)[0]
+            category = self._ns_to_category.get(namespace)
+            if category is None:
+                category = self._match_namespace(namespace)
+            categories[category].extend(resources)
         
+        self._categories = categories
         return categories
     
-    def create_overview_diagram(self, output_file: str = "azure_architecture_overview.png"):
+    def _match_namespace(self, namespace: str) -> str:
+        """Keyword-scan a namespace missing from the lookup (e.g. microsoft.webpubsub) and remember it"""
+        category = 'other'
+        for candidate, keywords in SERVICE_TYPE_MAPPING.items():
+            if any(keyword in namespace for keyword in keywords):
+                category = candidate
+                break
+        self._ns_to_category[namespace] = category
+        return category
+    
+    def _prepare_figure(self, fig, figsize: Tuple[float, float]):
+        """Return a cleared figure of the given size, creating one if none is shared"""
+        _init_matplotlib()
+        if self._rgba is None:
+            # Box and bar colors resolved to RGBA once instead of per patch
+            self._rgba = {key: to_rgba(color) for key, color in self.color_scheme.items()}
+            self._rgba_fallback = to_rgba('#808080')
+            # Shared font properties for the labels repeated in every box
+            self._fonts = {
+                'heading': FontProperties(size=12, weight='bold'),
+                'count': FontProperties(size=10, style='italic'),
+                'group': FontProperties(size=11, weight='bold'),
+                'group_detail': FontProperties(size=9),
+                'group_total': FontProperties(size=9, weight='bold'),
+                'detail': FontProperties(size=8),
+                'detail_bold': FontProperties(size=8, weight='bold'),
+                'detail_italic': FontProperties(size=8, style='italic'),
+            }
+        
+        if fig is None:
+            return plt.figure(figsize=figsize)
+        fig.clear()
+        fig.set_size_inches(figsize)
+        return fig
+    
+    def _save_figure(self, fig, output_file: str, dpi: int, fmt: str = 'png', **kwargs) -> str:
+        """Save as PNG with fast compression, or as SVG with no rasterization; return the path written"""
+        if fmt == 'svg':
+            output_file = os.path.splitext(output_file)[0] + '.svg'
+            fig.savefig(output_file, format='svg', bbox_inches='tight', **kwargs)
+        else:
+            fig.savefig(output_file, dpi=dpi, bbox_inches='tight', pil_kwargs=_PNG_PIL_KWARGS, **kwargs)
+        return output_file
+    
+    def create_overview_diagram(self, output_file: str = "azure_architecture_overview.png", dpi: int = 150, fig=None,
+                                fmt: str = 'png'):
         """Create a modern overview diagram of the entire architecture"""
         
-        categories = self.categorize_resources()
+        # Only categories with resources get a slot in the grid
+        categories = {category: resources for category, resources in self.categorize_resources().items()
+                      if resources}
         
         # Create figure with modern styling
-        fig, ax = plt.subplots(figsize=(16, 12))
+        owns_fig = fig is None
+        fig = self._prepare_figure(fig, (16, 12))
+        ax = fig.add_subplot(111)
         fig.patch.set_facecolor(self.color_scheme['background'])
         ax.set_facecolor(self.color_scheme['background'])
         
@@ -118,15 +232,12 @@ class ModernAzureDiagramGenerator:
         box_width = 0.25
         box_height = 0.15
         
-        positions = []
-        for row in range(rows):
-            for col in range(cols):
-                if len(positions) < len(categories):
-                    x = 0.1 + col * 0.3
-                    y = 0.8 - row * 0.2
-                    positions.append((x, y))
+        cols_idx, rows_idx = np.meshgrid(np.arange(cols), np.arange(rows))
+        positions = np.column_stack([0.1 + cols_idx.ravel() * 0.3,
+                                     0.8 - rows_idx.ravel() * 0.2])[:len(categories)].tolist()
         
-        # Draw category boxes
+        # Draw category boxes, collected so they render as one artist
+        boxes = []
         category_names = list(categories.keys())
         for i, (category, resources) in enumerate(categories.items()):
             if i >= len(positions):
@@ -138,39 +249,41 @@ class ModernAzureDiagramGenerator:
             box = FancyBboxPatch(
                 (x, y), box_width, box_height,
                 boxstyle="round,pad=0.01",
-                facecolor=self.color_scheme.get(category, '#808080'),
-                edgecolor=self.color_scheme['border'],
+                facecolor=self._rgba.get(category, self._rgba_fallback),
+                edgecolor=self._rgba['border'],
                 linewidth=2,
                 alpha=0.8
             )
-            ax.add_patch(box)
+            boxes.append(box)
             
             # Add category label
             ax.text(x + box_width/2, y + box_height - 0.03, 
                    category.replace('_', ' ').title(),
-                   ha='center', va='center', fontsize=12, fontweight='bold',
+                   ha='center', va='center', fontproperties=self._fonts['heading'],
                    color='white')
             
             # Add resource count
             ax.text(x + box_width/2, y + 0.05,
                    f"{len(resources)} resources",
-                   ha='center', va='center', fontsize=10,
-                   color='white', style='italic')
+                   ha='center', va='center', fontproperties=self._fonts['count'],
+                   color='white')
             
             # Add some example resource types
             if resources:
                 example_types = set()
                 for resource in resources[:3]:  # Show up to 3 example types
-                    service_type = resource.get('type', '').split('/')[-1]
+                    service_type = resource['_short_type']
                     if service_type:
                         example_types.add(service_type)
                 
                 examples_text = '\n'.join(list(example_types)[:2])  # Show 2 examples
                 ax.text(x + box_width/2, y + box_height/2 - 0.02,
                        examples_text,
-                       ha='center', va='center', fontsize=8,
+                       ha='center', va='center', fontproperties=self._fonts['detail'],
                        color='white', alpha=0.9)
         
+        ax.add_collection(PatchCollection(boxes, match_original=True))
+        
         # Add legend
         legend_y = 0.02
         ax.text(0.02, legend_y + 0.06, "Resource Categories:", 
@@ -187,19 +300,21 @@ class ModernAzureDiagramGenerator:
         ax.set_ylim(0, 1)
         ax.axis('off')
         
-        # Save with high DPI
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight', 
-                   facecolor=self.color_scheme['background'])
-        plt.close()
+        output_file = self._save_figure(fig, output_file, dpi, fmt,
+                                        facecolor=self.color_scheme['background'])
+        if owns_fig:
+            plt.close(fig)
         
         print(f"✅ Created overview diagram: {output_file}")
         return output_file
     
-    def create_resource_groups_diagram(self, output_file: str = "azure_resource_groups.png"):
+    def create_resource_groups_diagram(self, output_file: str = "azure_resource_groups.png", dpi: int = 150, fig=None,
+                                       fmt: str = 'png'):
         """Create a diagram showing resource groups and their contents"""
         
-        fig, ax = plt.subplots(figsize=(20, 14))
+        owns_fig = fig is None
+        fig = self._prepare_figure(fig, (20, 14))
+        ax = fig.add_subplot(111)
         fig.patch.set_facecolor(self.color_scheme['background'])
         ax.set_facecolor(self.color_scheme['background'])
         
@@ -216,8 +331,9 @@ class ModernAzureDiagramGenerator:
             ax.text(0.5, 0.5, "No resource groups found", ha='center', va='center',
                    fontsize=16, color=self.color_scheme['text'])
             ax.axis('off')
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            plt.close()
+            output_file = self._save_figure(fig, output_file, dpi, fmt)
+            if owns_fig:
+                plt.close(fig)
             return output_file
         
         # Calculate grid layout
@@ -227,23 +343,21 @@ class ModernAzureDiagramGenerator:
         box_width = 0.28
         box_height = 0.18
         
-        for i, rg in enumerate(resource_groups):
-            row = i // cols
-            col = i % cols
-            
-            x = 0.05 + col * 0.32
-            y = 0.85 - row * 0.22
-            
+        rows_idx, cols_idx = np.divmod(np.arange(len(resource_groups)), cols)
+        positions = np.column_stack([0.05 + cols_idx * 0.32, 0.85 - rows_idx * 0.22]).tolist()
+        
+        rg_boxes = []
+        for rg, (x, y) in zip(resource_groups, positions):
             # Resource group box
             rg_box = FancyBboxPatch(
                 (x, y), box_width, box_height,
                 boxstyle="round,pad=0.01",
                 facecolor='white',
-                edgecolor=self.color_scheme['network'],
+                edgecolor=self._rgba['network'],
                 linewidth=2,
                 alpha=0.9
             )
-            ax.add_patch(rg_box)
+            rg_boxes.append(rg_box)
             
             # RG name and location
             rg_name = rg.get('name', 'Unknown')
@@ -251,44 +365,43 @@ class ModernAzureDiagramGenerator:
             
             ax.text(x + box_width/2, y + box_height - 0.03,
                    f"📁 {rg_name}",
-                   ha='center', va='center', fontsize=11, fontweight='bold',
+                   ha='center', va='center', fontproperties=self._fonts['group'],
                    color=self.color_scheme['text'])
             
             ax.text(x + box_width/2, y + box_height - 0.06,
                    f"📍 {location}",
-                   ha='center', va='center', fontsize=9,
+                   ha='center', va='center', fontproperties=self._fonts['group_detail'],
                    color=self.color_scheme['text'], alpha=0.8)
             
             # Resources in this RG
             rg_resources = resources_by_rg.get(rg_name, [])
             
             # Group resources by type
-            resource_types = defaultdict(int)
-            for resource in rg_resources:
-                service_type = resource.get('type', '').split('/')[-1]
-                if service_type:
-                    resource_types[service_type] += 1
+            resource_types = Counter(resource['_short_type'] for resource in rg_resources)
+            resource_types.pop('', None)
             
-            # Display top resource types
+            # Display the most common resource types
             y_offset = 0.10
-            for j, (resource_type, count) in enumerate(list(resource_types.items())[:4]):
+            for j, (resource_type, count) in enumerate(resource_types.most_common(4)):
                 ax.text(x + 0.02, y + y_offset - j * 0.025,
                        f"• {resource_type}: {count}",
-                       ha='left', va='center', fontsize=8,
+                       ha='left', va='center', fontproperties=self._fonts['detail'],
                        color=self.color_scheme['text'])
             
             if len(resource_types) > 4:
                 ax.text(x + 0.02, y + y_offset - 4 * 0.025,
                        f"... and {len(resource_types) - 4} more types",
-                       ha='left', va='center', fontsize=8,
-                       color=self.color_scheme['text'], style='italic')
+                       ha='left', va='center', fontproperties=self._fonts['detail_italic'],
+                       color=self.color_scheme['text'])
             
             # Total resources count
             ax.text(x + box_width - 0.02, y + 0.02,
                    f"{len(rg_resources)} resources",
-                   ha='right', va='bottom', fontsize=9, fontweight='bold',
+                   ha='right', va='bottom', fontproperties=self._fonts['group_total'],
                    color=self.color_scheme['compute'])
         
+        ax.add_collection(PatchCollection(rg_boxes, match_original=True))
+        
         # Add timestamp
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         ax.text(0.98, 0.02, f"Generated: {timestamp}", 
@@ -299,18 +412,21 @@ class ModernAzureDiagramGenerator:
         ax.set_ylim(0, 1)
         ax.axis('off')
         
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight',
-                   facecolor=self.color_scheme['background'])
-        plt.close()
+        output_file = self._save_figure(fig, output_file, dpi, fmt,
+                                        facecolor=self.color_scheme['background'])
+        if owns_fig:
+            plt.close(fig)
         
         print(f"✅ Created resource groups diagram: {output_file}")
         return output_file
     
-    def create_network_topology_diagram(self, output_file: str = "azure_network_topology.png"):
+    def create_network_topology_diagram(self, output_file: str = "azure_network_topology.png", dpi: int = 150, fig=None,
+                                        fmt: str = 'png'):
         """Create a network topology diagram"""
         
-        fig, ax = plt.subplots(figsize=(18, 12))
+        owns_fig = fig is None
+        fig = self._prepare_figure(fig, (18, 12))
+        ax = fig.add_subplot(111)
         fig.patch.set_facecolor(self.color_scheme['background'])
         ax.set_facecolor(self.color_scheme['background'])
         
@@ -319,25 +435,22 @@ class ModernAzureDiagramGenerator:
         ax.text(0.5, 0.95, title, ha='center', va='top', transform=ax.transAxes,
                 fontsize=18, fontweight='bold', color=self.color_scheme['text'])
         
-        # Get network resources
-        network_resources = []
-        if 'resources' in self.architecture_data and 'by_type' in self.architecture_data['resources']:
-            for resource_type, resources in self.architecture_data['resources']['by_type'].items():
-                if 'microsoft.network' in resource_type.lower():
-                    network_resources.extend(resources)
+        # Network resources come from the shared categorization
+        network_resources = self.categorize_resources()['network']
         
         if not network_resources:
             ax.text(0.5, 0.5, "No network resources found", ha='center', va='center',
                    fontsize=16, color=self.color_scheme['text'])
             ax.axis('off')
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            plt.close()
+            output_file = self._save_figure(fig, output_file, dpi, fmt)
+            if owns_fig:
+                plt.close(fig)
             return output_file
         
         # Group network resources by type
         network_by_type = defaultdict(list)
         for resource in network_resources:
-            service_type = resource.get('type', '').split('/')[-1]
+            service_type = resource['_short_type']
             network_by_type[service_type].append(resource)
         
         # Create network diagram layout
@@ -351,36 +464,46 @@ class ModernAzureDiagramGenerator:
             'networkInterfaces': 0.2
         }
         
-        for service_type, resources in network_by_type.items():
-            y = y_positions.get(service_type, 0.1)
+        # Mapped types keep their own rows; the rows they leave free, plus the bottom row,
+        # go to the largest unmapped types so no two types share a row
+        type_rows = {service_type: y for service_type, y in y_positions.items() if service_type in network_by_type}
+        free_rows = [y for service_type, y in y_positions.items() if service_type not in network_by_type] + [0.1]
+        unmapped = sorted((service_type for service_type in network_by_type if service_type not in y_positions),
+                          key=lambda service_type: -len(network_by_type[service_type]))
+        type_rows.update(zip(unmapped, free_rows))
+        
+        box_xs = (0.1 + np.arange(5) * 0.15).tolist()
+        boxes = []
+        for service_type, y in type_rows.items():
+            resources = network_by_type[service_type]
             
             # Service type header
             ax.text(0.05, y + 0.05, f"🌐 {service_type} ({len(resources)})",
-                   fontsize=12, fontweight='bold', color=self.color_scheme['network'])
+                   fontproperties=self._fonts['heading'], color=self.color_scheme['network'])
             
             # Draw resource boxes
-            for i, resource in enumerate(resources[:5]):  # Show max 5 per type
-                x = 0.1 + i * 0.15
-                
+            for x, resource in zip(box_xs, resources[:5]):  # Show max 5 per type
                 # Resource box
                 box = FancyBboxPatch(
                     (x, y), 0.12, 0.04,
                     boxstyle="round,pad=0.005",
-                    facecolor=self.color_scheme['network'],
-                    edgecolor=self.color_scheme['border'],
+                    facecolor=self._rgba['network'],
+                    edgecolor=self._rgba['border'],
                     alpha=0.7
                 )
-                ax.add_patch(box)
+                boxes.append(box)
                 
                 # Resource name
                 name = resource.get('name', 'Unknown')[:12]
                 ax.text(x + 0.06, y + 0.02, name,
-                       ha='center', va='center', fontsize=8,
-                       color='white', fontweight='bold')
+                       ha='center', va='center', fontproperties=self._fonts['detail_bold'],
+                       color='white')
             
             if len(resources) > 5:
                 ax.text(0.85, y + 0.02, f"... +{len(resources) - 5} more",
-                       fontsize=8, color=self.color_scheme['text'], style='italic')
+                       fontproperties=self._fonts['detail_italic'], color=self.color_scheme['text'])
+        
+        ax.add_collection(PatchCollection(boxes, match_original=True))
         
         # Add timestamp
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -392,15 +515,15 @@ class ModernAzureDiagramGenerator:
         ax.set_ylim(0, 1)
         ax.axis('off')
         
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight',
-                   facecolor=self.color_scheme['background'])
-        plt.close()
+        output_file = self._save_figure(fig, output_file, dpi, fmt,
+                                        facecolor=self.color_scheme['background'])
+        if owns_fig:
+            plt.close(fig)
         
         print(f"✅ Created network topology diagram: {output_file}")
         return output_file
     
-    def create_cost_analysis_chart(self, output_file: str = "azure_cost_analysis.png"):
+    def create_cost_analysis_chart(self, output_file: str = "azure_cost_analysis.png", fig=None):
         """Create a cost analysis visualization"""
         
         categories = self.categorize_resources()
@@ -412,13 +535,17 @@ class ModernAzureDiagramGenerator:
             print("❌ No resources found for cost analysis")
             return None
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        owns_fig = fig is None
+        fig = self._prepare_figure(fig, (16, 8))
+        ax1, ax2 = fig.subplots(1, 2)
         fig.patch.set_facecolor(self.color_scheme['background'])
         
         # Pie chart of resource distribution
         labels = [k.replace('_', ' ').title() for k in non_empty_categories.keys()]
-        sizes = [len(v) for v in non_empty_categories.values()]
-        colors = [self.color_scheme.get(k, '#808080') for k in non_empty_categories.keys()]
+        sizes = np.fromiter((len(v) for v in non_empty_categories.values()), dtype=np.int32,
+                            count=len(non_empty_categories))
+        bar_positions = np.arange(len(labels))
+        colors = [self._rgba.get(k, self._rgba_fallback) for k in non_empty_categories.keys()]
         
         wedges, texts, autotexts = ax1.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
                                           startangle=90, textprops={'fontsize': 10})
@@ -426,12 +553,12 @@ class ModernAzureDiagramGenerator:
                      color=self.color_scheme['text'], pad=20)
         
         # Bar chart of resource counts
-        ax2.bar(range(len(labels)), sizes, color=colors, alpha=0.8)
+        ax2.bar(bar_positions, sizes, color=colors, alpha=0.8)
         ax2.set_xlabel('Service Categories', fontsize=12, color=self.color_scheme['text'])
         ax2.set_ylabel('Number of Resources', fontsize=12, color=self.color_scheme['text'])
         ax2.set_title('Resource Counts by Category', fontsize=14, fontweight='bold',
                      color=self.color_scheme['text'], pad=20)
-        ax2.set_xticks(range(len(labels)))
+        ax2.set_xticks(bar_positions)
         ax2.set_xticklabels(labels, rotation=45, ha='right')
         
         # Style the charts
@@ -446,16 +573,17 @@ class ModernAzureDiagramGenerator:
                 ha='right', va='bottom', fontsize=8, 
                 color=self.color_scheme['text'], alpha=0.7)
         
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight',
-                   facecolor=self.color_scheme['background'])
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, output_file, 300, facecolor=self.color_scheme['background'])
+        if owns_fig:
+            plt.close(fig)
         
         print(f"✅ Created cost analysis chart: {output_file}")
         return output_file
     
     def generate_all_diagrams(self):
         """Generate all available diagrams"""
+        global _FORK_GENERATOR
         
         output_dir = "azure_diagrams_png"
         os.makedirs(output_dir, exist_ok=True)
@@ -463,30 +591,59 @@ class ModernAzureDiagramGenerator:
         print("🎨 Generating modern PNG diagrams...")
         print("="*50)
         
-        generated_files = []
-        
-        # Overview diagram
-        overview_file = os.path.join(output_dir, "azure_architecture_overview.png")
-        self.create_overview_diagram(overview_file)
-        generated_files.append(overview_file)
-        
-        # Resource groups diagram
-        rg_file = os.path.join(output_dir, "azure_resource_groups.png")
-        self.create_resource_groups_diagram(rg_file)
-        generated_files.append(rg_file)
-        
-        # Network topology diagram
-        network_file = os.path.join(output_dir, "azure_network_topology.png")
-        self.create_network_topology_diagram(network_file)
-        generated_files.append(network_file)
-        
-        # Cost analysis chart
-        cost_file = os.path.join(output_dir, "azure_cost_analysis.png")
-        cost_result = self.create_cost_analysis_chart(cost_file)
-        if cost_result:
-            generated_files.append(cost_file)
-        
-        return generated_files
+        diagrams = [
+            ('create_overview_diagram', os.path.join(output_dir, "azure_architecture_overview.png")),
+            ('create_resource_groups_diagram', os.path.join(output_dir, "azure_resource_groups.png")),
+            ('create_network_topology_diagram', os.path.join(output_dir, "azure_network_topology.png")),
+            ('create_cost_analysis_chart', os.path.join(output_dir, "azure_cost_analysis.png")),
+        ]
+        
+        # The same export rendered by the same generator code needs no rendering, as long as
+        # every file that render produced is still on disk
+        cache_file = os.path.join(output_dir, ".render_cache.json")
+        cache_key = None
+        if self._input_hash is not None:
+            cache_key = f"{self._input_hash}:{os.stat(__file__).st_mtime_ns}"
+            try:
+                with open(cache_file, 'r') as f:
+                    cached = json.load(f)
+                if cached['key'] == cache_key and all(os.path.exists(path) for path in cached['files']):
+                    print("♻️  Architecture data unchanged, reusing existing diagrams")
+                    return cached['files']
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # no usable record of a previous render
+        
+        # Warm everything the workers share before forking
+        _init_matplotlib()
+        self.categorize_resources()
+        
+        if _CAN_FORK:
+            # Forked workers see this generator, and its loaded export, copy-on-write
+            _FORK_GENERATOR = self
+            try:
+                workers = min(len(diagrams), os.cpu_count() or 1)
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    results = pool.starmap(_render_forked, diagrams, chunksize=1)
+            finally:
+                _FORK_GENERATOR = None
+        else:
+            # One figure is cleared and reused for every diagram
+            fig = plt.figure()
+            results = [getattr(self, method)(output_file, fig=fig) for method, output_file in diagrams]
+            plt.close(fig)
+        
+        # The cost chart returns None when there is nothing to chart; a chart left
+        # over from an earlier export would no longer describe this data
+        produced = [output_file for output_file in results if output_file]
+        for _, output_file in diagrams:
+            if output_file not in produced and os.path.exists(output_file):
+                os.remove(output_file)
+        
+        if cache_key is not None:
+            with open(cache_file, 'w') as f:
+                json.dump({'key': cache_key, 'files': produced}, f)
+        
+        return produced
 
 def main():
     """Main diagram generation process"""
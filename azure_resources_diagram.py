@@ -4,141 +4,239 @@ Azure Resources Diagram Generator
 Creates comprehensive diagrams showing all major Azure resources organized by categories.
 """
 
-from diagrams import Diagram, Cluster, Edge
-from diagrams.azure.compute import *
-from diagrams.azure.database import *
-from diagrams.azure.analytics import *
-from diagrams.azure.devops import *
-from diagrams.azure.general import *
-from diagrams.azure.identity import *
-from diagrams.azure.integration import *
-from diagrams.azure.iot import *
-from diagrams.azure.migration import *
-from diagrams.azure.ml import *
-from diagrams.azure.mobile import *
-from diagrams.azure.network import *
-from diagrams.azure.security import *
-from diagrams.azure.storage import *
-from diagrams.azure.web import *
+from diagrams import Diagram, Cluster, Node, setdiagram
+import argparse
 import os
+import subprocess
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from types import TracebackType
+from typing import Dict, List, Optional, Tuple, Type
 
-def create_comprehensive_azure_diagram():
-    """Create a comprehensive diagram of all Azure resources"""
+_node_load_icon = Node._load_icon
+
+@lru_cache(maxsize=None)
+def _class_icon(node_class: type) -> str:
+    """Resolve a node class's icon path once instead of for every node of that class"""
+    return _node_load_icon(node_class)
+
+def _cached_load_icon(node: Node) -> str:
+    """Node._load_icon replacement backed by the per-class cache"""
+    return _class_icon(type(node))
+
+# The icon path depends only on class attributes, so nodes sharing a class share the result
+Node._load_icon = _cached_load_icon
+
+# Created once at import; every diagram is written here
+OUTPUT_DIR = "azure_diagrams"
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Output paths without extension, one per diagram
+OUT_OVERVIEW = f"{OUTPUT_DIR}/azure_resources_overview"
+OUT_COMPUTE = f"{OUTPUT_DIR}/azure_compute_detailed"
+OUT_STORAGE = f"{OUTPUT_DIR}/azure_storage_detailed"
+OUT_NETWORK = f"{OUTPUT_DIR}/azure_network_detailed"
+
+# Vector SVG is the primary output; the PNG alongside it is rendered at Graphviz's default 96 DPI
+OUTFORMAT = ["svg", "png"]
+
+class PipedDiagram(Diagram):
+    """Diagram that pipes its DOT source into Graphviz instead of writing and deleting a .gv file"""
+    
+    def render(self) -> None:
+        """Lay the graph out once and write every output format from that single run"""
+        formats = self.outformat if isinstance(self.outformat, list) else [self.outformat]
+        command = [self.dot.engine]
+        for fmt in formats:
+            command += [f"-T{fmt}", "-o", f"{self.filename}.{fmt}"]
+        subprocess.run(command, input=self.dot.source.encode("utf-8"), check=True)
+    
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.render()
+        setdiagram(None)
+
+@lru_cache(maxsize=None)
+def overview_clusters() -> Tuple[Tuple[str, Tuple[Tuple[type, str], ...]], ...]:
+    """Clusters of the overview diagram as (title, ((node class, label), ...)), in drawing order"""
+    # Imported here so the detail diagrams do not pay for the overview's icon modules
+    from diagrams.azure.analytics import (Databricks, EventHubs, Hdinsightclusters, LogAnalyticsWorkspaces,
+                                          StreamAnalyticsJobs, SynapseAnalytics)
+    from diagrams.azure.compute import (VM, AppServices, BatchAccounts, ContainerInstances, Disks, FunctionApps,
+                                        KubernetesServices, ServiceFabricClusters, VMScaleSet)
+    from diagrams.azure.database import (CacheForRedis, CosmosDb, DataFactory, DatabaseForMysqlServers,
+                                         DatabaseForPostgresqlServers, SQLDatabases, SQLManagedInstances)
+    from diagrams.azure.devops import ApplicationInsights, Artifacts, Devops, Pipelines
+    from diagrams.azure.general import Resourcegroups, Servicehealth, Templates
+    from diagrams.azure.identity import ActiveDirectory
+    from diagrams.azure.integration import APIManagement, EventGridTopics, LogicApps, ServiceBus
+    from diagrams.azure.iot import DigitalTwins, IotCentralApplications, IotHub
+    from diagrams.azure.ml import BotServices, CognitiveServices, MachineLearningServiceWorkspaces
+    from diagrams.azure.network import (ApplicationGateway, CDNProfiles, DNSZones, ExpressrouteCircuits, Firewall,
+                                        LoadBalancers, TrafficManagerProfiles, VirtualNetworkGateways,
+                                        VirtualNetworks)
+    from diagrams.azure.security import KeyVaults, SecurityCenter, Sentinel
+    from diagrams.azure.storage import BlobStorage, DataLakeStorage, QueuesStorage, StorageAccounts, TableStorage
+    
+    return (
+        ("Compute Services", (
+            (VM, "Virtual Machines"),
+            (VMScaleSet, "VM Scale Sets"),
+            (KubernetesServices, "AKS"),
+            (ContainerInstances, "Container Instances"),
+            (AppServices, "App Service"),
+            (FunctionApps, "Azure Functions"),
+            (BatchAccounts, "Azure Batch"),
+            (ServiceFabricClusters, "Service Fabric"),
+        )),
+        ("Storage Services", (
+            (BlobStorage, "Blob Storage"),
+            (Disks, "Disk Storage"),
+            (StorageAccounts, "File Storage"),
+            (QueuesStorage, "Queue Storage"),
+            (TableStorage, "Table Storage"),
+            (DataLakeStorage, "Data Lake Storage"),
+        )),
+        ("Database Services", (
+            (SQLDatabases, "SQL Database"),
+            (CosmosDb, "Cosmos DB"),
+            (DatabaseForMysqlServers, "MySQL"),
+            (DatabaseForPostgresqlServers, "PostgreSQL"),
+            (CacheForRedis, "Redis Cache"),
+            (SQLManagedInstances, "SQL Managed Instance"),
+        )),
+        ("Networking Services", (
+            (VirtualNetworks, "Virtual Network"),
+            (LoadBalancers, "Load Balancer"),
+            (ApplicationGateway, "Application Gateway"),
+            (VirtualNetworkGateways, "VPN Gateway"),
+            (ExpressrouteCircuits, "ExpressRoute"),
+            (TrafficManagerProfiles, "Traffic Manager"),
+            (CDNProfiles, "CDN"),
+            (DNSZones, "DNS"),
+            (Firewall, "Azure Firewall"),
+        )),
+        ("Security & Identity", (
+            (ActiveDirectory, "Azure AD"),
+            (KeyVaults, "Key Vault"),
+            (SecurityCenter, "Security Center"),
+            (Sentinel, "Azure Sentinel"),
+        )),
+        ("AI & Machine Learning", (
+            (CognitiveServices, "Cognitive Services"),
+            (MachineLearningServiceWorkspaces, "ML Service"),
+            (BotServices, "Bot Services"),
+        )),
+        ("Analytics & Big Data", (
+            (SynapseAnalytics, "Synapse Analytics"),
+            (DataFactory, "Data Factory"),
+            (Databricks, "Databricks"),
+            (Hdinsightclusters, "HDInsight"),
+            (StreamAnalyticsJobs, "Stream Analytics"),
+        )),
+        ("Integration Services", (
+            (LogicApps, "Logic Apps"),
+            (ServiceBus, "Service Bus"),
+            (EventGridTopics, "Event Grid"),
+            (EventHubs, "Event Hubs"),
+            (APIManagement, "API Management"),
+        )),
+        ("DevOps Services", (
+            (Devops, "Azure DevOps"),
+            (Artifacts, "Artifacts"),
+            (Pipelines, "Pipelines"),
+        )),
+        ("IoT Services", (
+            (IotHub, "IoT Hub"),
+            (IotCentralApplications, "IoT Central"),
+            (DigitalTwins, "Digital Twins"),
+        )),
+        ("Management & Monitoring", (
+            (Servicehealth, "Azure Monitor"),
+            (LogAnalyticsWorkspaces, "Log Analytics"),
+            (ApplicationInsights, "Application Insights"),
+            (Templates, "Automation"),
+            (Resourcegroups, "Resource Manager"),
+        )),
+    )
+
+SVG_NS = "http://www.w3.org/2000/svg"
+
+# Clicking a cluster box hides or shows the nodes tagged with that cluster's id
+_TOGGLE_SCRIPT = """
+function toggleCluster(cluster) {
+  var collapse = cluster.getAttribute("data-collapsed") !== "true";
+  cluster.setAttribute("data-collapsed", collapse);
+  document.querySelectorAll('[data-cluster="' + cluster.id + '"]').forEach(function (node) {
+    node.style.display = collapse ? "none" : "";
+  });
+}
+"""
+
+def _make_clusters_collapsible(svg_path: str, members: Dict[str, List[str]]) -> None:
+    """Add click-to-collapse handlers to the clusters of a Graphviz SVG"""
+    ET.register_namespace("", SVG_NS)
+    ET.register_namespace("xlink", "http://www.w3.org/1999/xlink")
+    tree = ET.parse(svg_path)
+    root = tree.getroot()
+    
+    # Graphviz titles each cluster group "cluster_<label>" and each node group with its node id
+    groups = {group.findtext(f"{{{SVG_NS}}}title"): group
+              for group in root.iter(f"{{{SVG_NS}}}g") if group.get("class") in ("cluster", "node")}
+    for title, node_ids in members.items():
+        cluster = groups.get(f"cluster_{title}")
+        if cluster is None:
+            continue
+        cluster.set("onclick", "toggleCluster(this)")
+        cluster.set("cursor", "pointer")
+        for node_id in node_ids:
+            node = groups.get(node_id)
+            if node is not None:
+                node.set("data-cluster", cluster.get("id"))
     
-    # Set output directory
-    output_dir = "azure_diagrams"
-    os.makedirs(output_dir, exist_ok=True)
+    script = ET.Element(f"{{{SVG_NS}}}script")
+    script.text = _TOGGLE_SCRIPT
+    root.insert(0, script)
+    tree.write(svg_path, encoding="utf-8", xml_declaration=True)
+
+def create_comprehensive_azure_diagram() -> None:
+    """Create a comprehensive diagram of all Azure resources"""
     
-    with Diagram("Azure Resources Overview", 
-                 filename=f"{output_dir}/azure_resources_overview", 
-                 show=False, 
-                 direction="TB",
-                 graph_attr={"size": "20,20!", "dpi": "300"}):
+    members: Dict[str, List[str]] = {}
+    with PipedDiagram("Azure Resources Overview", 
+                      filename=OUT_OVERVIEW,
+                      show=False, 
+                      direction="LR",
+                      outformat=OUTFORMAT,
+                      # Tighter node and rank spacing keeps the edge-free overview compact
+                      graph_attr={"size": "20,20", "nodesep": "0.3", "ranksep": "0.4"}):
         
-        # Compute Services
-        with Cluster("Compute Services"):
-            vm = VirtualMachines("Virtual Machines")
-            vmss = VMScaleSet("VM Scale Sets")
-            aks = KubernetesServices("AKS")
-            container_instances = ContainerInstances("Container Instances")
-            app_service = AppServices("App Service")
-            functions = FunctionApps("Azure Functions")
-            batch = Batch("Azure Batch")
-            service_fabric = ServiceFabric("Service Fabric")
-            
-        # Storage Services  
-        with Cluster("Storage Services"):
-            blob_storage = BlobStorage("Blob Storage")
-            disk_storage = DiskStorage("Disk Storage")
-            file_storage = FileStorage("File Storage")
-            queue_storage = QueueStorage("Queue Storage")
-            table_storage = TableStorage("Table Storage")
-            data_lake = DataLakeStorage("Data Lake Storage")
-            
-        # Database Services
-        with Cluster("Database Services"):
-            sql_database = SQLDatabases("SQL Database")
-            cosmos_db = CosmosDb("Cosmos DB")
-            mysql = DatabaseForMySQL("MySQL")
-            postgresql = DatabaseForPostgreSQL("PostgreSQL")
-            redis = RedisCache("Redis Cache")
-            sql_managed = SQLManagedInstance("SQL Managed Instance")
-            
-        # Networking Services
-        with Cluster("Networking Services"):
-            vnet = VirtualNetworks("Virtual Network")
-            load_balancer = LoadBalancers("Load Balancer")
-            app_gateway = ApplicationGateway("Application Gateway")
-            vpn_gateway = VPNGateway("VPN Gateway")
-            express_route = ExpressRouteCircuits("ExpressRoute")
-            traffic_manager = TrafficManagerProfiles("Traffic Manager")
-            cdn = CDNProfiles("CDN")
-            dns = DNSZones("DNS")
-            firewall = Firewall("Azure Firewall")
-            
-        # Security & Identity
-        with Cluster("Security & Identity"):
-            active_directory = ActiveDirectory("Azure AD")
-            key_vault = KeyVaults("Key Vault")
-            security_center = SecurityCenter("Security Center")
-            sentinel = Sentinel("Azure Sentinel")
-            
-        # AI & Machine Learning
-        with Cluster("AI & Machine Learning"):
-            cognitive_services = CognitiveServices("Cognitive Services")
-            ml_service = MachineLearningService("ML Service")
-            bot_services = BotServices("Bot Services")
-            
-        # Analytics & Big Data
-        with Cluster("Analytics & Big Data"):
-            synapse = SynapseAnalytics("Synapse Analytics")
-            data_factory = DataFactory("Data Factory")
-            databricks = Databricks("Databricks")
-            hdinsight = HDInsight("HDInsight")
-            stream_analytics = StreamAnalytics("Stream Analytics")
-            
-        # Integration Services
-        with Cluster("Integration Services"):
-            logic_apps = LogicApps("Logic Apps")
-            service_bus = ServiceBus("Service Bus")
-            event_grid = EventGrid("Event Grid")
-            event_hubs = EventHubs("Event Hubs")
-            api_management = APIManagement("API Management")
-            
-        # DevOps Services
-        with Cluster("DevOps Services"):
-            devops = DevopsOrganization("Azure DevOps")
-            artifacts = Artifacts("Artifacts")
-            pipelines = Pipelines("Pipelines")
-            
-        # IoT Services
-        with Cluster("IoT Services"):
-            iot_hub = IoTHub("IoT Hub")
-            iot_central = IoTCentral("IoT Central")
-            digital_twins = DigitalTwins("Digital Twins")
-            
-        # Management & Monitoring
-        with Cluster("Management & Monitoring"):
-            monitor = Monitor("Azure Monitor")
-            log_analytics = LogAnalytics("Log Analytics")
-            application_insights = ApplicationInsights("Application Insights")
-            automation = Automation("Automation")
-            resource_manager = ResourceGroups("Resource Manager")
+        for title, cluster_members in overview_clusters():
+            with Cluster(title):
+                members[title] = [node_class(label).nodeid for node_class, label in cluster_members]
+    
+    # The SVG overview doubles as an interactive view with collapsible clusters
+    if "svg" in OUTFORMAT:
+        _make_clusters_collapsible(f"{OUT_OVERVIEW}.svg", members)
 
-def create_detailed_compute_diagram():
+def create_detailed_compute_diagram() -> None:
     """Create detailed diagram for compute services"""
+    from diagrams.azure.compute import (VM, AppServices, ContainerInstances, ContainerRegistries, FunctionApps,
+                                        KubernetesServices)
+    from diagrams.azure.integration import LogicApps
+    from diagrams.azure.web import AppServices as WebAppServices
     
-    output_dir = "azure_diagrams"
-    
-    with Diagram("Azure Compute Services", 
-                 filename=f"{output_dir}/azure_compute_detailed", 
-                 show=False,
-                 direction="LR"):
+    with PipedDiagram("Azure Compute Services", 
+                      filename=OUT_COMPUTE,
+                      show=False,
+                      direction="LR",
+                      outformat=OUTFORMAT):
         
         with Cluster("Virtual Machines"):
-            vm_windows = VirtualMachines("Windows VMs")
-            vm_linux = VirtualMachines("Linux VMs")
-            vm_spot = VirtualMachines("Spot VMs")
+            VM("Windows VMs")
+            VM("Linux VMs")
+            VM("Spot VMs")
             
         with Cluster("Containers"):
             aks = KubernetesServices("AKS")
@@ -147,77 +245,75 @@ def create_detailed_compute_diagram():
             
         with Cluster("Serverless"):
             functions = FunctionApps("Functions")
-            logic_apps = LogicApps("Logic Apps")
+            LogicApps("Logic Apps")
             
         with Cluster("Platform Services"):
             app_service = AppServices("App Service")
-            static_web_apps = StaticWebApps("Static Web Apps")
+            WebAppServices("Static Web Apps")
             
         # Connections
         acr >> aks
         acr >> aci
         app_service >> functions
 
-def create_detailed_storage_diagram():
+def create_detailed_storage_diagram() -> None:
     """Create detailed diagram for storage services"""
+    from diagrams.azure.storage import BlobStorage, DataLakeStorage, QueuesStorage, StorageAccounts, TableStorage
     
-    output_dir = "azure_diagrams"
-    
-    with Diagram("Azure Storage Services", 
-                 filename=f"{output_dir}/azure_storage_detailed", 
-                 show=False,
-                 direction="TB"):
+    with PipedDiagram("Azure Storage Services", 
+                      filename=OUT_STORAGE,
+                      show=False,
+                      direction="TB",
+                      outformat=OUTFORMAT):
         
-        with Cluster("Storage Account Types"):
-            general_purpose = BlobStorage("General Purpose v2")
-            blob_storage = BlobStorage("Blob Storage")
-            block_blob = BlobStorage("Block Blob Storage")
-            file_storage = FileStorage("File Storage")
-            
-        with Cluster("Storage Tiers"):
-            hot_tier = BlobStorage("Hot Tier")
-            cool_tier = BlobStorage("Cool Tier")
-            archive_tier = BlobStorage("Archive Tier")
-            
-        with Cluster("Data Services"):
-            data_lake = DataLakeStorage("Data Lake Gen2")
-            queue_storage = QueueStorage("Queue Storage")
-            table_storage = TableStorage("Table Storage")
+        for title, cluster_members in (
+            ("Storage Account Types", ((BlobStorage, "General Purpose v2"), (BlobStorage, "Blob Storage"),
+                                       (BlobStorage, "Block Blob Storage"), (StorageAccounts, "File Storage"))),
+            ("Storage Tiers", ((BlobStorage, "Hot Tier"), (BlobStorage, "Cool Tier"), (BlobStorage, "Archive Tier"))),
+            ("Data Services", ((DataLakeStorage, "Data Lake Gen2"), (QueuesStorage, "Queue Storage"),
+                               (TableStorage, "Table Storage"))),
+        ):
+            with Cluster(title):
+                for node_class, label in cluster_members:
+                    node_class(label)
 
-def create_network_diagram():
+def create_network_diagram() -> None:
     """Create detailed network architecture diagram"""
+    from diagrams.azure.network import (ApplicationGateway, CDNProfiles, DDOSProtectionPlans, DNSPrivateZones,
+                                        DNSZones, ExpressrouteCircuits, Firewall, FrontDoors, LoadBalancers,
+                                        NetworkSecurityGroupsClassic, Subnets, TrafficManagerProfiles,
+                                        VirtualNetworkGateways, VirtualNetworks, VirtualWans)
     
-    output_dir = "azure_diagrams"
-    
-    with Diagram("Azure Network Architecture", 
-                 filename=f"{output_dir}/azure_network_detailed", 
-                 show=False,
-                 direction="TB"):
+    with PipedDiagram("Azure Network Architecture", 
+                      filename=OUT_NETWORK,
+                      show=False,
+                      direction="TB",
+                      outformat=OUTFORMAT):
         
         with Cluster("Core Networking"):
             vnet = VirtualNetworks("Virtual Network")
             subnet = Subnets("Subnets")
-            nsg = NetworkSecurityGroups("Network Security Groups")
+            nsg = NetworkSecurityGroupsClassic("Network Security Groups")
             
         with Cluster("Load Balancing"):
             load_balancer = LoadBalancers("Load Balancer")
             app_gateway = ApplicationGateway("Application Gateway")
-            traffic_manager = TrafficManagerProfiles("Traffic Manager")
-            front_door = FrontDoors("Front Door")
+            TrafficManagerProfiles("Traffic Manager")
+            FrontDoors("Front Door")
             
         with Cluster("Connectivity"):
-            vpn_gateway = VPNGateway("VPN Gateway")
-            express_route = ExpressRouteCircuits("ExpressRoute")
-            virtual_wan = VirtualWans("Virtual WAN")
+            vpn_gateway = VirtualNetworkGateways("VPN Gateway")
+            ExpressrouteCircuits("ExpressRoute")
+            VirtualWans("Virtual WAN")
             
         with Cluster("Security"):
             firewall = Firewall("Azure Firewall")
-            ddos = DDOSProtectionPlans("DDoS Protection")
+            DDOSProtectionPlans("DDoS Protection")
             
         with Cluster("DNS & CDN"):
-            dns = DNSZones("DNS Zones")
-            private_dns = PrivateDnsZones("Private DNS")
-            cdn = CDNProfiles("CDN")
+            DNSZones("DNS Zones")
+            DNSPrivateZones("Private DNS")
+            CDNProfiles("CDN")
             
         # Network flow
         vnet >> subnet
@@ -227,32 +323,56 @@ def create_network_diagram():
         vpn_gateway >> vnet
         firewall >> vnet
 
-def main():
+def needs_rebuild(filename: str) -> bool:
+    """True if any output format of a diagram is missing or older than this script"""
+    source_mtime = os.path.getmtime(__file__)
+    for fmt in OUTFORMAT:
+        path = f"{filename}.{fmt}"
+        if not os.path.exists(path) or os.path.getmtime(path) < source_mtime:
+            return True
+    return False
+
+def main() -> None:
     """Generate all Azure resource diagrams"""
-    print("Generating Azure resource diagrams...")
-    
-    # Create output directory
-    os.makedirs("azure_diagrams", exist_ok=True)
-    
-    # Generate diagrams
-    create_comprehensive_azure_diagram()
-    print("✓ Created comprehensive Azure resources overview")
+    parser = argparse.ArgumentParser(description="Generate Azure resource diagrams")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate diagrams even if they are newer than this script")
+    args = parser.parse_args()
     
-    create_detailed_compute_diagram()
-    print("✓ Created detailed compute services diagram")
-    
-    create_detailed_storage_diagram()
-    print("✓ Created detailed storage services diagram")
+    print("Generating Azure resource diagrams...")
     
-    create_network_diagram()
-    print("✓ Created detailed network architecture diagram")
+    # Each diagram runs its own Graphviz render, so the four are laid out side by side
+    renderers = {
+        create_comprehensive_azure_diagram: (OUT_OVERVIEW, "✓ Created comprehensive Azure resources overview"),
+        create_detailed_compute_diagram: (OUT_COMPUTE, "✓ Created detailed compute services diagram"),
+        create_detailed_storage_diagram: (OUT_STORAGE, "✓ Created detailed storage services diagram"),
+        create_network_diagram: (OUT_NETWORK, "✓ Created detailed network architecture diagram"),
+    }
+    # Diagrams newer than this script are current, since their content is fixed in the code
+    pending = {create: message for create, (filename, message) in renderers.items()
+               if args.force or needs_rebuild(filename)}
+    if not pending:
+        print("✓ All diagrams are up to date (use --force to regenerate)")
+    else:
+        # One throwaway render pulls dot, its plugins and the fontconfig cache in before the
+        # workers start, so they share a warm font cache instead of racing to build it
+        try:
+            subprocess.run(["dot", "-Tpng"], input=b"digraph { warm }", capture_output=True, check=False)
+        except FileNotFoundError:
+            print("❌ Graphviz 'dot' not found. Please install Graphviz and make sure it is on PATH")
+            return
+        with ProcessPoolExecutor(max_workers=len(pending)) as pool:
+            futures = {pool.submit(create): message for create, message in pending.items()}
+            for future in as_completed(futures):
+                future.result()
+                print(futures[future])
     
-    print("\nAll diagrams have been generated in the 'azure_diagrams' directory!")
-    print("Files created:")
-    print("- azure_resources_overview.png")
-    print("- azure_compute_detailed.png")
-    print("- azure_storage_detailed.png")
-    print("- azure_network_detailed.png")
+    # The closing summary goes out as a single write
+    print("\n".join([
+        f"\nAll diagrams have been generated in the '{OUTPUT_DIR}' directory!",
+        "Files created:",
+        *(f"- {os.path.basename(filename)}.{' / .'.join(OUTFORMAT)}" for filename, _ in renderers.values()),
+    ]))
 
 if __name__ == "__main__":
     main()
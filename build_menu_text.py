@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Build the main menu's static screens from menu_spec.json into _generated_text.py
+Run after editing menu_spec.json: python3 build_menu_text.py
+"""
+
+import json
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+SPEC_FILE = BASE_DIR / "menu_spec.json"
+OUTPUT_FILE = BASE_DIR / "_generated_text.py"
+
+HEADER = '''"""
+Static menu screens generated by build_menu_text.py from menu_spec.json - do not edit
+"""
+'''
+
+def render_screens(spec: dict) -> dict:
+    """Join each screen's lines and expand the {banner} placeholder"""
+    banner_spec = spec["banner"]
+    banner = banner_spec["cap"] + banner_spec["fill"] * banner_spec["width"] + banner_spec["cap"]
+    return {name: "\n".join(lines).replace("{banner}", banner)
+            for name, lines in spec["screens"].items()}
+
+def emit_module(screens: dict) -> str:
+    """Write each screen as one constant built from implicitly joined line literals"""
+    parts = [HEADER]
+    for name, text in screens.items():
+        parts.append(f"\n{name} = (\n")
+        for line in text.splitlines(keepends=True):
+            parts.append(f"    {line!r}\n")
+        parts.append(")\n")
+    return "".join(parts)
+
+def main():
+    """Regenerate _generated_text.py"""
+    with open(SPEC_FILE, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+
+    screens = render_screens(spec)
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        f.write(emit_module(screens))
+
+    print(f"✓ Wrote {len(screens)} screens to {OUTPUT_FILE.name}")
+
+if __name__ == "__main__":
+    main()